@@ -56,7 +56,7 @@ class ActionCard(ttk.Frame):
         left_frame.pack(side=tk.LEFT, fill=tk.Y)
         left_frame.pack_propagate(False)
 
-        icon_label = ttk.Label(left_frame, text=self.action.ui.icon, font=('Segoe UI Emoji', 18), style='Card.TLabel')
+        icon_label = ttk.Label(left_frame, text=self.action.ui.icon, font=ModernTheme.CARD_ICON_FONT, style='Card.TLabel')
         icon_label.pack(expand=True)
 
         # Right side - Info
@@ -67,7 +67,7 @@ class ActionCard(ttk.Frame):
         info_frame = ttk.Frame(right_frame, style='Card.TFrame')
         info_frame.pack(fill=tk.X, pady=(ModernTheme.PADDING_MD, 0))
 
-        self.type_label = ttk.Label(info_frame, text=self.action.type.upper(), font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_SM, 'bold'), style='Card.TLabel')
+        self.type_label = ttk.Label(info_frame, text=self.action.type.upper(), font=ModernTheme.SMALL_BOLD_FONT, style='Card.TLabel')
         self.type_label.pack(anchor=tk.W)
 
         summary = self.action.get_summary()
@@ -127,6 +127,9 @@ class ActionCard(ttk.Frame):
         self.is_selected = False
         self.selection_indicator.configure(bg=ModernTheme.BACKGROUND)
 
+    def update_summary(self):
+        self.desc_label.configure(text=self.action.get_summary())
+
     def update_enabled_state(self, enabled: bool):
         self.action.enabled = enabled
         if not enabled:
@@ -100,10 +100,11 @@ class ActionHandlers:
             full_path, region_path, region_dict = self.app.screenshot_manager.capture_point_with_context(
                 x, y, context_size=100
             )
+            thumb_path = self.app.screenshot_manager.create_thumbnail(region_path)
         else:
             full_path = self.app.screenshot_manager._generate_filename()
             full_filepath = self.app.screenshot_manager.screenshots_dir / full_path
-            screenshot.save(str(full_filepath), 'PNG')
+            screenshot.save(str(full_filepath), 'PNG', compress_level=self.app.screenshot_manager.CAPTURE_COMPRESS_LEVEL)
 
             region_dict = {
                 'x': x,
@@ -116,11 +117,11 @@ class ActionHandlers:
             region = screenshot.crop((x, y, x + region_dict['width'], y + region_dict['height']))
             region_filename = self.app.screenshot_manager._generate_filename("region")
             region_path = str(self.app.screenshot_manager.regions_dir / region_filename)
-            region.save(region_path, 'PNG')
+            region.save(region_path, 'PNG', compress_level=self.app.screenshot_manager.CAPTURE_COMPRESS_LEVEL)
             full_path = str(full_filepath)
 
-        # Create thumbnail
-        thumb_path = self.app.screenshot_manager.create_thumbnail(region_path)
+            # Thumbnail from the crop we already have
+            thumb_path = self.app.screenshot_manager.create_thumbnail(region_path, image=region)
 
         # Create action with visual metadata
         action_params = {
@@ -233,12 +234,12 @@ class ActionHandlers:
 
         # Title
         tk.Label(content, text="Press Key",
-                font=(ModernTheme.FONT_FAMILY, 14, 'bold'),
+                font=ModernTheme.DIALOG_TITLE_FONT,
                 bg=ModernTheme.BACKGROUND, fg=ModernTheme.FOREGROUND).pack(anchor=tk.W, pady=(0, 15))
 
         # Key selection
         tk.Label(content, text="Key to press:",
-                font=(ModernTheme.FONT_FAMILY, 10),
+                font=ModernTheme.BODY_FONT,
                 bg=ModernTheme.BACKGROUND, fg=ModernTheme.FOREGROUND).pack(anchor=tk.W, pady=(0, 5))
 
         key_var = tk.StringVar(value='enter')
@@ -252,7 +253,7 @@ class ActionHandlers:
 
         # Description
         tk.Label(content, text="Description (optional):",
-                font=(ModernTheme.FONT_FAMILY, 10),
+                font=ModernTheme.BODY_FONT,
                 bg=ModernTheme.BACKGROUND, fg=ModernTheme.FOREGROUND).pack(anchor=tk.W, pady=(0, 5))
 
         desc_entry = ttk.Entry(content, width=30)
@@ -69,6 +69,7 @@ class ActionRecorder:
         # Tracking
         self.last_action_time = 0
         self.last_mouse_pos = (0, 0)
+        self._full_screenshot_taken = False
         self.typing_buffer = ""
         self.typing_timeout = 1.0  # Time to wait before flushing typing buffer
         self.last_type_time = 0
@@ -93,7 +94,8 @@ class ActionRecorder:
         self.recorded_events.clear()
         self.actions.clear()
         self.typing_buffer = ""
-        self.last_action_time = time.time()
+        self.last_action_time = time.monotonic()
+        self._full_screenshot_taken = False
 
         # Start listeners
         self.mouse_listener = mouse.Listener(
@@ -127,7 +129,7 @@ class ActionRecorder:
             return
 
         self.state = RecordingState.RECORDING
-        self.last_action_time = time.time()
+        self.last_action_time = time.monotonic()
         self._trigger_state_change(RecordingState.RECORDING)
         logging.info("Recording resumed")
 
@@ -144,6 +146,11 @@ class ActionRecorder:
         # Stop listeners
         if self.mouse_listener:
             self.mouse_listener.stop()
+            # Clicks grab the screen on the listener thread; once it has exited,
+            # close the mss handle it opened
+            if self.mouse_listener is not threading.current_thread():
+                self.mouse_listener.join()
+                self.screenshot_manager.release_grabber(self.mouse_listener)
             self.mouse_listener = None
 
         if self.keyboard_listener:
@@ -157,6 +164,9 @@ class ActionRecorder:
 
         self._trigger_state_change(RecordingState.STOPPED)
 
+        # Screenshots of the last clicks may still be encoding
+        self.screenshot_manager.wait_for_pending_saves()
+
         # Process and optimize actions
         if self.merge_similar_actions:
             self._optimize_actions()
@@ -180,7 +190,7 @@ class ActionRecorder:
             return
 
         # Check minimum interval
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_action_time < self.min_action_interval:
             return
 
@@ -203,7 +213,7 @@ class ActionRecorder:
             return
 
         # Check minimum interval
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_action_time < self.min_action_interval:
             return
 
@@ -243,7 +253,7 @@ class ActionRecorder:
             if hasattr(key, 'char') and key.char:
                 # Regular character
                 self.typing_buffer += key.char
-                self.last_type_time = time.time()
+                self.last_type_time = time.monotonic()
 
                 # Reset typing timer
                 if self.typing_timer:
@@ -257,7 +267,7 @@ class ActionRecorder:
 
             elif key == keyboard.Key.space:
                 self.typing_buffer += ' '
-                self.last_type_time = time.time()
+                self.last_type_time = time.monotonic()
 
             elif key == keyboard.Key.enter:
                 # Flush typing and record enter as separate action
@@ -267,7 +277,7 @@ class ActionRecorder:
             elif key == keyboard.Key.backspace:
                 if self.typing_buffer:
                     self.typing_buffer = self.typing_buffer[:-1]
-                    self.last_type_time = time.time()
+                    self.last_type_time = time.monotonic()
 
         except AttributeError:
             # Special key without char attribute
@@ -308,15 +318,18 @@ class ActionRecorder:
         # Capture screenshot if enabled
         if self.capture_screenshots:
             try:
-                # Capture point with context
-                full_path, region_path, region_dict = \
-                    self.screenshot_manager.capture_point_with_context(x, y, context_size=100)
-
-                # Create thumbnail
-                thumb_path = self.screenshot_manager.create_thumbnail(region_path)
+                # Grab the screen now; encoding the images happens off the listener thread.
+                # Only the first click keeps a full screenshot (it becomes the canvas
+                # background); later clicks only need their context region.
+                full_path, region_path, thumb_path, region_dict = \
+                    self.screenshot_manager.capture_point_with_context_async(
+                        x, y, context_size=100, save_full=not self._full_screenshot_taken
+                    )
+                self._full_screenshot_taken = True
 
                 # Add visual metadata
-                action.visual.screenshot_path = full_path
+                if full_path:
+                    action.visual.screenshot_path = full_path
                 action.visual.capture_region = region_dict
                 action.visual.thumbnail_path = thumb_path
                 action.visual.screen_resolution = self.screenshot_manager.get_screen_resolution()
@@ -381,6 +394,7 @@ class ActionRecorder:
                     merged_text = current.params.get('text', '') + next_action.params.get('text', '')
                     current.params['text'] = merged_text
                     current.params['description'] = f"Type: {merged_text[:30]}{'...' if len(merged_text) > 30 else ''}"
+                    current.invalidate_summary()
                     i += 1  # Skip next action
 
                 # Merge consecutive scrolls in same direction
@@ -390,6 +404,7 @@ class ActionRecorder:
                         total_amount = current.params.get('amount', 0) + next_action.params.get('amount', 0)
                         current.params['amount'] = total_amount
                         current.params['description'] = f"Scroll {total_amount}"
+                        current.invalidate_summary()
                         i += 1  # Skip next action
 
             optimized.append(current)
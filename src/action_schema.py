@@ -10,6 +10,9 @@ import json
 class VisualMetadata:
     """Visual metadata for an action"""
 
+    # One instance per action, so skip the per-instance __dict__
+    __slots__ = ('screenshot_path', 'capture_region', 'thumbnail_path', 'screen_resolution')
+
     def __init__(self, screenshot_path: Optional[str] = None,
                  capture_region: Optional[Dict[str, int]] = None,
                  thumbnail_path: Optional[str] = None,
@@ -42,6 +45,8 @@ class VisualMetadata:
 class UIMetadata:
     """UI presentation metadata for an action"""
 
+    __slots__ = ('color', 'order', 'collapsed', 'icon')
+
     # Color scheme for different action types
     ACTION_COLORS = {
         'click': '#4A90E2',       # Blue
@@ -110,6 +115,9 @@ class UIMetadata:
 class EnhancedAction:
     """Enhanced action model with visual and UI metadata"""
 
+    __slots__ = ('type', '_summary_cache', '_description', 'enabled', 'wait_after',
+                 'params', 'visual', 'ui')
+
     def __init__(self, action_type: str, **kwargs):
         """
         Initialize enhanced action
@@ -119,6 +127,7 @@ class EnhancedAction:
             **kwargs: Action-specific parameters and metadata
         """
         self.type = action_type
+        self._summary_cache: Optional[str] = None
         self.description = kwargs.get('description', '')
         self.enabled = kwargs.get('enabled', True)
         self.wait_after = kwargs.get('wait_after', 0.5)
@@ -147,6 +156,15 @@ class EnhancedAction:
         if not self.ui.icon:
             self.ui.icon = UIMetadata.get_icon_for_action(action_type)
 
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+        self._summary_cache = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         result = {
@@ -175,8 +193,18 @@ class EnhancedAction:
         """Check if action has visual metadata"""
         return bool(self.visual.screenshot_path or self.visual.capture_region)
 
+    def invalidate_summary(self):
+        """Drop the cached summary; call after mutating params in place"""
+        self._summary_cache = None
+
     def get_summary(self) -> str:
-        """Get human-readable summary of action"""
+        """Get human-readable summary of action (cached until invalidated)"""
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+
+    def _build_summary(self) -> str:
+        """Build human-readable summary of action"""
         if self.description:
             return self.description
 
@@ -320,7 +320,7 @@ class CaptureConfirmDialog:
         # Title
         title = ttk.Label(container, text="Confirm Screen Capture",
                          style='Title.TLabel',
-                         font=(ModernTheme.FONT_FAMILY, 14, 'bold'))
+                         font=ModernTheme.DIALOG_TITLE_FONT)
         title.pack(pady=(0, 10))
 
         # Info
@@ -6,6 +6,7 @@ import time
 import logging
 import copy
 import os
+import threading
 from typing import List, Dict, Any, Optional, Callable
 
 
@@ -15,7 +16,9 @@ class SimulationExecutor:
     def __init__(self, stop_callback: Optional[Callable] = None,
                  pause_callback: Optional[Callable] = None,
                  status_callback: Optional[Callable] = None,
-                 progress_callback: Optional[Callable] = None):
+                 progress_callback: Optional[Callable] = None,
+                 stop_event: Optional[threading.Event] = None,
+                 pause_event: Optional[threading.Event] = None):
         """
         Initialize executor
 
@@ -24,9 +27,12 @@ class SimulationExecutor:
             pause_callback: Callback that returns True if simulation should pause
             status_callback: Callback to update status messages
             progress_callback: Callback to update progress (step_num, total, action_type, details)
+            stop_event: Event that is set when simulation should stop (overrides stop_callback)
+            pause_event: Event that is set while simulation is paused (overrides pause_callback)
         """
-        self.stop_callback = stop_callback
-        self.pause_callback = pause_callback
+        self.stop_event = stop_event
+        self.stop_callback = stop_event.is_set if stop_event is not None else stop_callback
+        self.pause_callback = pause_event.is_set if pause_event is not None else pause_callback
         self.status_callback = status_callback
         self.progress_callback = progress_callback
         pyautogui.FAILSAFE = True
@@ -42,7 +48,11 @@ class SimulationExecutor:
     def handle_pause(self):
         """Handle pause state - wait until unpaused or stopped"""
         while self.is_paused() and not self.should_stop():
-            time.sleep(0.1)  # Check every 100ms
+            # Check every 100ms; with a stop event, wake immediately on stop
+            if self.stop_event is not None:
+                self.stop_event.wait(0.1)
+            else:
+                time.sleep(0.1)
 
     def update_status(self, message: str):
         """Update status message"""
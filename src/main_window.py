@@ -5,6 +5,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import logging
+import logging.handlers
+from contextlib import contextmanager
 
 # Encoding setup
 if sys.platform.startswith('win'):
@@ -30,15 +32,26 @@ from src.recording_manager import RecordingManager
 from src.workflow_actions import WorkflowActions
 
 # Configure logging
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# File output is buffered so UI callbacks don't pay a write() per record; the
+# buffer is flushed when full, on ERROR records, and by logging.shutdown() at exit
+_log_file_handler = logging.FileHandler('automation_studio.log', encoding='utf-8', delay=True)
+_log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('automation_studio.log', encoding='utf-8'),
+        logging.handlers.MemoryHandler(capacity=128, target=_log_file_handler),
         logging.StreamHandler()
     ]
 )
 
+# Workflow cards are created this many at a time; further cards are built as
+# the list is scrolled toward its end
+CARD_BATCH_SIZE = 50
+
 class AutomationStudio:
     """Main Automation Studio application"""
 
@@ -56,11 +69,21 @@ class AutomationStudio:
         self.selected_action_indices = []
         self.selected_action_index = None  # Index of the last selected action (for single selection)
         self.action_cards = []  # List of ActionCard widgets
+        self._visual_action_indices = None  # Indices of actions with visual data; None until the next redraw rebuilds it
         self.batch_data = []
         self.batch_columns = []
         self.is_dirty = False
         self.current_filepath = None
 
+        # Nested batched_updates() depth and the work deferred until it unwinds
+        self._batch_depth = 0
+        self._needs_refresh = False
+        self._needs_redraw = False
+
+        # Card indices whose enabled state / summary must be redrawn on next idle
+        self._pending_card_updates = set()
+        self._card_flush_scheduled = False
+
         # Initialize managers
         self.screenshot_manager = ScreenshotManager()
         self.template_manager = TemplateManager(self)
@@ -74,6 +97,7 @@ class AutomationStudio:
         # Create studio layout first
         self.studio_callbacks = {
             'add_step': self.action_handlers.show_add_step_menu,
+            'load_more': self._load_more_cards,
         }
         self.studio = StudioLayout(self.root, callbacks=self.studio_callbacks)
 
@@ -142,35 +166,115 @@ class AutomationStudio:
 
         self.visual_canvas.add_annotation(annotation)
 
+    @contextmanager
+    def batched_updates(self):
+        """Defer workflow refreshes and canvas redraws until the outermost block exits"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._needs_refresh:
+                    self._needs_refresh = False
+                    self._refresh_workflow()
+                if self._needs_redraw:
+                    self._needs_redraw = False
+                    self._redraw_canvas_annotations()
+
+    def _redraw_canvas_annotations(self):
+        """Rebuild canvas annotations for the actions that carry visual data"""
+        if self._batch_depth:
+            self._needs_redraw = True
+            return
+
+        if self._visual_action_indices is None:
+            self._visual_action_indices = [
+                i for i, action in enumerate(self.actions) if action.has_visual_data()
+            ]
+
+        self.visual_canvas.clear_annotations()
+        for i in self._visual_action_indices:
+            self._add_canvas_annotation(self.actions[i], i)
+
     def _refresh_workflow(self):
         """Refresh workflow panel with current actions"""
+        if self._batch_depth:
+            self._needs_refresh = True
+            return
+
+        # Rebuild at least as far as before, so the view and the selection survive
+        rebuild_upto = max(CARD_BATCH_SIZE, len(self.action_cards),
+                           max(self.selected_action_indices, default=-1) + 1)
+
         self.studio.workflow_panel.clear_actions()
         self.action_cards.clear()
 
-        for i, action in enumerate(self.actions):
-            comment_text = None
-            if self.comment_manager.core_manager.has_comment(i):
-                comment_text = self.comment_manager.core_manager.get_comment(i).text
-
-            card = ActionCard(
-                self.studio.workflow_panel.actions_frame,
-                action, i,
-                on_select=lambda index, event: self.workflow_actions.select_action(index, event),
-                on_toggle=self.workflow_actions.toggle_action,
-                on_delete=self.workflow_actions.delete_action,
-                on_duplicate=self.workflow_actions.duplicate_action,
-                on_reorder=self.workflow_actions.reorder_action,
-                on_enable_selected=self.workflow_actions.enable_selected,
-                on_disable_selected=self.workflow_actions.disable_selected,
-                comment=comment_text
+        # The action list may have changed in any way; the next redraw rescans it
+        self._visual_action_indices = None
+
+        # Cards past rebuild_upto follow on scroll
+        self._materialize_cards(rebuild_upto)
+
+        self.studio.workflow_panel.update_counter(len(self.actions))
+
+    def _materialize_cards(self, upto: int):
+        """Build the not-yet-created cards for actions before index upto"""
+        upto = min(upto, len(self.actions))
+        if self._batch_depth or len(self.action_cards) >= upto:
+            return
+
+        comments = self.comment_manager.core_manager.comments_by_index
+        selected = set(self.selected_action_indices)
+        for i in range(len(self.action_cards), upto):
+            self._create_action_card(i, self.actions[i], comments, selected)
+
+    def _load_more_cards(self):
+        """Workflow list scrolled near its end: build the next batch of cards"""
+        self._materialize_cards(len(self.action_cards) + CARD_BATCH_SIZE)
+
+    def _append_to_workflow(self, start: int):
+        """Add cards for actions appended from start on, keeping the existing cards"""
+        if self._batch_depth or start < len(self.action_cards):
+            # Cards are out of step with the action list; rebuild them all
+            self._refresh_workflow()
+            return
+
+        if self._visual_action_indices is not None:
+            self._visual_action_indices.extend(
+                i for i in range(start, len(self.actions)) if self.actions[i].has_visual_data()
             )
-            card.pack(fill=tk.X, pady=5)
-            self.action_cards.append(card)
 
-            self.studio.workflow_panel.bind_mousewheel_to_widget(card)
+        # Cards that directly follow the built ones get the next batch, so the new
+        # steps show up even when the list is already scrolled to its end
+        if start == len(self.action_cards):
+            self._load_more_cards()
 
         self.studio.workflow_panel.update_counter(len(self.actions))
 
+    def _create_action_card(self, i: int, action: EnhancedAction, comments, selected) -> ActionCard:
+        """Create, pack and register the workflow card for action i"""
+        comment = comments.get(i)
+        comment_text = comment.text if comment else None
+
+        card = ActionCard(
+            self.studio.workflow_panel.actions_frame,
+            action, i,
+            on_select=self.workflow_actions.select_action,
+            on_toggle=self.workflow_actions.toggle_action,
+            on_delete=self.workflow_actions.delete_action,
+            on_duplicate=self.workflow_actions.duplicate_action,
+            on_reorder=self.workflow_actions.reorder_action,
+            on_enable_selected=self.workflow_actions.enable_selected,
+            on_disable_selected=self.workflow_actions.disable_selected,
+            comment=comment_text
+        )
+        if i in selected:
+            card.select()
+        card.pack(fill=tk.X, pady=5)
+        self.action_cards.append(card)
+        return card
+
     def _on_property_change(self, index: int, property_name: str, value):
         """Handle property change from properties panel"""
         if 0 <= index < len(self.actions):
@@ -178,28 +282,45 @@ class AutomationStudio:
 
             if property_name == 'enabled':
                 action.enabled = value
-                if index < len(self.action_cards):
-                    self.action_cards[index].update_enabled_state(value)
+                self._schedule_card_update(index)
+            elif property_name == 'position':
+                action.params['x'], action.params['y'] = value
+                action.invalidate_summary()
             else:
                 action.params[property_name] = value
+                action.invalidate_summary()
 
-            if property_name in ['x', 'y'] and action.has_visual_data():
+            if property_name in ('x', 'y', 'position') and action.has_visual_data():
                 if 'x' in action.visual.capture_region:
                     action.visual.capture_region['x'] = action.params.get('x', 0)
                 if 'y' in action.visual.capture_region:
                     action.visual.capture_region['y'] = action.params.get('y', 0)
 
-                self.visual_canvas.clear_annotations()
-                for i, act in enumerate(self.actions):
-                    if act.has_visual_data():
-                        self._add_canvas_annotation(act, i)
+                self._redraw_canvas_annotations()
 
             if property_name == 'description':
-                self._refresh_workflow()
+                self._schedule_card_update(index)
 
             self.update_status(f"Updated {property_name} for action #{index + 1}")
             self.is_dirty = True
 
+    def _schedule_card_update(self, index: int):
+        """Mark a card dirty and redraw all dirty cards once the UI is idle"""
+        self._pending_card_updates.add(index)
+        if not self._card_flush_scheduled:
+            self._card_flush_scheduled = True
+            self.root.after_idle(self._flush_card_updates)
+
+    def _flush_card_updates(self):
+        """Apply pending enabled-state and summary updates to their cards"""
+        self._card_flush_scheduled = False
+        pending, self._pending_card_updates = self._pending_card_updates, set()
+        for index in pending:
+            if index < len(self.action_cards) and index < len(self.actions):
+                card = self.action_cards[index]
+                card.update_enabled_state(self.actions[index].enabled)
+                card.update_summary()
+
     def _recapture_position(self, index: int):
         """Recapture position for an action"""
         if 0 <= index < len(self.actions):
@@ -234,55 +355,30 @@ class AutomationStudio:
             # CRITICAL: Directly update on the action in the list
             self.actions[index].params['x'] = x
             self.actions[index].params['y'] = y
+            self.actions[index].invalidate_summary()
 
             # If the action has a description that was likely based on coordinates,
             # clear it so that get_summary() will show the new coordinates
             if self.actions[index].description and ('at (' in self.actions[index].description or 'Click at' in self.actions[index].description or 'Set value at' in self.actions[index].description):
                 self.actions[index].description = ''
 
-            logging.info(f"Position updated: action #{index + 1} -> ({x}, {y})")
-            logging.info(f"Action params (direct from list): x={self.actions[index].params.get('x')}, y={self.actions[index].params.get('y')}")
-            logging.info(f"Action ID: {id(action)} vs List ID: {id(self.actions[index])}")
-            logging.info(f"Params ID: {id(action.params)} vs List Params ID: {id(self.actions[index].params)}")
+            logging.debug("Position updated: action #%d -> (%s, %s)", index + 1, x, y)
+            logging.debug("Action params (direct from list): x=%s, y=%s",
+                          self.actions[index].params.get('x'), self.actions[index].params.get('y'))
 
             # Update visual capture region if it exists
             if action.has_visual_data() and action.visual.capture_region:
                 action.visual.capture_region['x'] = x
                 action.visual.capture_region['y'] = y
 
-            # Save the current selection state before refresh
-            previously_selected = self.selected_action_indices.copy()
-
             # Refresh workflow panel to show updated coordinates
             self._refresh_workflow()
 
-            logging.info(f"Action summary from list AFTER refresh: {self.actions[index].get_summary()}")
-            logging.info(f"Action summary from variable AFTER refresh: {action.get_summary()}")
-
-            # After refresh, restore the selection state
-            self.selected_action_indices = previously_selected
-            
-            # Update single selection index
-            if len(self.selected_action_indices) == 1:
-                self.selected_action_index = self.selected_action_indices[0]
-            elif len(self.selected_action_indices) == 0:
-                self.selected_action_index = None
-            else:
-                # When multiple are selected, keep the last selected as the single index
-                self.selected_action_index = self.selected_action_indices[-1]
-            
-            # Update UI selection state
-            for i, card in enumerate(self.action_cards):
-                if i in self.selected_action_indices:
-                    card.select()
-                else:
-                    card.deselect()
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("Action summary AFTER refresh: %s", self.actions[index].get_summary())
 
             # Refresh visual canvas
-            self.visual_canvas.clear_annotations()
-            for i, act in enumerate(self.actions):
-                if act.has_visual_data():
-                    self._add_canvas_annotation(act, i)
+            self._redraw_canvas_annotations()
 
             # Refresh property panel
             if index in self.selected_action_indices:
@@ -311,19 +407,23 @@ class AutomationStudio:
                 'description': action.get_summary()
             }
 
-            detail_text = json.dumps(details, indent=2)
-
             dialog = tk.Toplevel(self.root)
             dialog.title(f"Action #{index + 1} Details")
             dialog.geometry("500x400")
 
             text_widget = tk.Text(dialog, font=('Consolas', 10), wrap=tk.WORD)
             text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            text_widget.insert('1.0', detail_text)
-            text_widget.configure(state='disabled')
 
             ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
 
+            # Show the window first, then serialize and fill in the details once idle
+            def populate():
+                text_widget.insert('1.0', json.dumps(details, indent=2))
+                text_widget.configure(state='disabled')
+
+            dialog.update_idletasks()
+            dialog.after_idle(populate)
+
     def open_variable_manager(self):
         """Open the variable manager dialog."""
         def on_save(data, columns):
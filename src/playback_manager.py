@@ -8,9 +8,20 @@ from src.execution_popup import ExecutionPopup
 from pynput import keyboard
 import threading
 
+
+def _has_batch_marker(value) -> bool:
+    """Check whether a param value references a batch column"""
+    return isinstance(value, str) and '{batch:' in value
+
+
 class PlaybackManager:
+    # Interval (ms) at which queued progress updates are pushed to the popup
+    PROGRESS_REFRESH_MS = 33
+
     def __init__(self, app):
         self.app = app
+        self._latest_progress = None
+        self._progress_after_id = None
 
     def play_workflow(self):
         """Play workflow with a transparent popup for status."""
@@ -18,61 +29,78 @@ class PlaybackManager:
             messagebox.showwarning("No Actions", "No actions to play.")
             return
 
-        is_batch = any('{batch:' in str(action.params.get('text', '')) or '{batch:' in str(action.params.get('value', '')) for action in self.app.actions if action.enabled)
-
-        if is_batch and not self.app.batch_data:
-            messagebox.showwarning("No Batch Data", "Workflow requires batch data. Please add data via 'Edit > Manage Variables'.")
-            return
-
         # --- Setup for execution ---
+        # Show the popup right away; batch detection and serialization run on
+        # the worker thread so large workflows don't stall the Tk event loop.
         self.app.root.withdraw()
         popup = ExecutionPopup(self.app.root)
+        popup.update_progress("Preparing...", "")
         popup.show()
 
-        stop_execution = False
-        pause_execution = False
+        stop_event = threading.Event()
+        pause_event = threading.Event()
 
-        def on_press(key):
-            nonlocal stop_execution, pause_execution
-            try:
-                if key.char == 's':
-                    stop_execution = True
-                elif key.char == 'p':
-                    pause_execution = not pause_execution
-            except AttributeError:
-                pass
-
-        listener = keyboard.Listener(on_press=on_press)
-        listener.start()
+        def toggle_pause():
+            if pause_event.is_set():
+                pause_event.clear()
+            else:
+                pause_event.set()
 
-        def stop_callback():
-            return stop_execution
-
-        def pause_callback():
-            return pause_execution
+        listener = keyboard.GlobalHotKeys({
+            's': stop_event.set,
+            'p': toggle_pause,
+        })
+        listener.start()
 
         def progress_callback(current_step, next_step):
-            self.app.root.after(0, popup.update_progress, current_step, next_step)
+            # Only the most recent step is kept; the Tk-side timer picks it up
+            self._latest_progress = (current_step, next_step)
 
         executor = SimulationExecutor(
-            stop_callback=stop_callback,
-            pause_callback=pause_callback,
+            stop_event=stop_event,
+            pause_event=pause_event,
             status_callback=lambda msg: self.app.root.after(0, self.app.update_status, msg),
             progress_callback=progress_callback
         )
 
+        actions = list(self.app.actions)
+        batch_data = self.app.batch_data
+
         def execution_target():
             try:
-                classic_actions = ActionSchemaManager.export_simulation(self.app.actions, include_visual=False)
+                is_batch = any(_has_batch_marker(action.params.get('text')) or _has_batch_marker(action.params.get('value')) for action in actions if action.enabled)
+
+                if is_batch and not batch_data:
+                    self.app.root.after(0, messagebox.showwarning, "No Batch Data", "Workflow requires batch data. Please add data via 'Edit > Manage Variables'.")
+                    return
+
+                classic_actions = ActionSchemaManager.export_simulation(actions, include_visual=False)
                 if is_batch:
-                    executor.execute_batch(classic_actions, self.app.batch_data)
+                    executor.execute_batch(classic_actions, batch_data)
                 else:
                     executor.execute_simulation(classic_actions)
             finally:
                 listener.stop()
+                self.app.root.after(0, self._stop_progress_updates)
                 self.app.root.after(0, popup.destroy)
                 self.app.root.after(0, self.app.root.deiconify)
 
+        self._latest_progress = None
+        self._progress_after_id = self.app.root.after(self.PROGRESS_REFRESH_MS, self._drain_progress, popup)
+
         thread = threading.Thread(target=execution_target)
         thread.daemon = True
         thread.start()
+
+    def _drain_progress(self, popup, shown=None):
+        """Push the latest queued progress to the popup and re-arm the timer."""
+        progress = self._latest_progress
+        if progress is not None and progress is not shown:
+            popup.update_progress(*progress)
+        self._progress_after_id = self.app.root.after(self.PROGRESS_REFRESH_MS, self._drain_progress, popup, progress)
+
+    def _stop_progress_updates(self):
+        """Cancel the progress refresh timer."""
+        if self._progress_after_id is not None:
+            self.app.root.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
@@ -2,103 +2,227 @@
 Property Editor Widgets for Properties Panel
 Context-aware property editing with validation
 """
+import re
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Sequence
 from src.theme import ModernTheme, Icons
 from src.action_schema import EnhancedAction
 
 
+# Choice lists shared by every panel
+CLEAR_METHODS = ('ctrl_a', 'backspace', 'triple_click')
+WAIT_TYPES = ('duration', 'image')
+SCROLL_TYPES = ('amount', 'top', 'bottom')
+
+# Spinbox range used when a number editor has no explicit bound
+_NUM_BOUNDS = (-999999, 999999)
+
+# Complete decimal numbers accepted by NumberPropertyEditor
+_NUMBER_RE = re.compile(r'[-+]?(\d+\.?\d*|\.\d+)')
+
+
 class PropertyEditor(ttk.Frame):
     """Base class for property editors"""
 
-    def __init__(self, parent, label: str, on_change: Optional[Callable] = None):
+    # Typing is reported through on_change once keystrokes pause for this long
+    CHANGE_DELAY_MS = 150
+
+    def __init__(self, parent, label: str, on_change: Optional[Callable] = None,
+                 name: Optional[str] = None):
         super().__init__(parent, style='TFrame')
         self.label = label
         self.on_change = on_change
+        # When set, on_change is called as on_change(name, value)
+        self._prop_name = name
+        self._pending_change = None
+        # Last value shown or reported; editors set it so repeats are not re-sent
+        self.value = None
 
         self.pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
 
         if label:
-            label_widget = ttk.Label(self, text=label, style='TLabel', font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD, 'bold'))
+            label_widget = ttk.Label(self, text=label, style='TLabel', font=ModernTheme.EDITOR_FONT_BOLD)
             label_widget.pack(anchor=tk.W, pady=(0, ModernTheme.PADDING_SM))
 
     def _trigger_change(self, value: Any):
+        if value == self.value:
+            return
+        self.value = value
         if self.on_change:
-            self.on_change(value)
+            if self._prop_name is None:
+                self.on_change(value)
+            else:
+                self.on_change(self._prop_name, value)
+
+    def _on_change(self, event=None):
+        """Read the current widget value and report it (overridden by editors)"""
+
+    def _schedule_change(self, *args):
+        """Debounce _on_change until typing pauses"""
+        if self._pending_change is not None:
+            self.after_cancel(self._pending_change)
+        self._pending_change = self.after(self.CHANGE_DELAY_MS, self._fire_pending_change)
+
+    def _fire_pending_change(self):
+        self._pending_change = None
+        self._on_change()
+
+    def _cancel_change(self):
+        """Drop a pending debounced change without reporting it"""
+        if self._pending_change is not None:
+            self.after_cancel(self._pending_change)
+            self._pending_change = None
+
+    def get_value(self) -> Any:
+        """Last value shown or reported, without reading the widget"""
+        return self.value
+
+    def set_value(self, value: Any):
+        """Show value without reporting it through on_change (overridden by editors)"""
+
+    def _flush_change(self, event=None):
+        """Report a pending debounced change right away"""
+        if self._pending_change is not None:
+            self.after_cancel(self._pending_change)
+            self._fire_pending_change()
+
+    def _bind_debounced(self, widget, var: tk.Variable):
+        """Debounce writes to widget's variable and flush on focus loss or Return"""
+        # The trace only fires when the text actually changes, so navigation
+        # and modifier keys no longer schedule a change
+        var.trace_add('write', self._schedule_change)
+        widget.bind('<FocusOut>', self._flush_change)
+        widget.bind('<Return>', self._flush_change)
+
+    def destroy(self):
+        # Don't drop an edit that is still waiting on the debounce timer
+        self._flush_change()
+        super().destroy()
 
 
 class TextPropertyEditor(PropertyEditor):
-    def __init__(self, parent, label: str, value: str, on_change: Optional[Callable] = None):
-        super().__init__(parent, label, on_change)
-        self.entry = ttk.Entry(self, font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD))
+    def __init__(self, parent, label: str, value: str, on_change: Optional[Callable] = None,
+                 name: Optional[str] = None):
+        super().__init__(parent, label, on_change, name)
+        self.value = str(value) if value else ""
+        self.var = tk.StringVar(self, value=self.value)
+        self.entry = ttk.Entry(self, textvariable=self.var, font=ModernTheme.EDITOR_FONT)
         self.entry.pack(fill=tk.X)
-        self.entry.insert(0, str(value) if value else "")
-        self.entry.bind('<KeyRelease>', lambda e: self._trigger_change(self.entry.get()))
+        self._bind_debounced(self.entry, self.var)
+
+    def _on_change(self, event=None):
+        self._trigger_change(self.var.get())
+
+    def set_value(self, value: Any):
+        self.value = str(value) if value else ""
+        self.var.set(self.value)
+        self._cancel_change()
 
 
 class HybridTextPropertyEditor(PropertyEditor):
-    def __init__(self, parent, label: str, value: str, batch_columns: List[str], on_change: Optional[Callable] = None):
-        super().__init__(parent, label, on_change)
+    def __init__(self, parent, label: str, value: str, batch_columns: List[str], on_change: Optional[Callable] = None,
+                 name: Optional[str] = None):
+        super().__init__(parent, label, on_change, name)
         self.batch_columns = batch_columns
 
         editor_frame = ttk.Frame(self)
         editor_frame.pack(fill=tk.X)
 
-        self.entry = ttk.Entry(editor_frame, font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD))
+        self.value = str(value) if value else ""
+        self.var = tk.StringVar(self, value=self.value)
+        self.entry = ttk.Entry(editor_frame, textvariable=self.var, font=ModernTheme.EDITOR_FONT)
         self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.entry.insert(0, str(value) if value else "")
-        self.entry.bind('<KeyRelease>', lambda e: self._trigger_change(self.entry.get()))
+        self._bind_debounced(self.entry, self.var)
 
         if self.batch_columns:
-            self.combobox = ttk.Combobox(editor_frame, values=self.batch_columns, state='readonly', width=15)
+            # Columns are copied into Tk only when the dropdown is opened
+            self.combobox = ttk.Combobox(editor_frame, state='readonly', width=15, postcommand=self._load_columns)
             self.combobox.pack(side=tk.LEFT, padx=(ModernTheme.PADDING_SM, 0))
             self.combobox.set("Insert Column...")
             self.combobox.bind('<<ComboboxSelected>>', self._on_column_select)
 
+    def _on_change(self, event=None):
+        self._trigger_change(self.var.get())
+
+    def set_value(self, value: Any):
+        self.value = str(value) if value else ""
+        self.var.set(self.value)
+        self._cancel_change()
+        if self.batch_columns:
+            self.combobox.set("Insert Column...")
+
+    def _load_columns(self):
+        self.combobox['values'] = self.batch_columns
+
     def _on_column_select(self, event):
         selected_column = self.combobox.get()
         if selected_column:
             placeholder = f"{{batch:{selected_column}}}"
-            self.entry.delete(0, tk.END)
-            self.entry.insert(0, placeholder)
+            self.var.set(placeholder)
+            # Picking a column is a deliberate edit, so report it without the typing delay
+            self._cancel_change()
             self._trigger_change(placeholder)
 
 
 class NumberPropertyEditor(PropertyEditor):
-    def __init__(self, parent, label: str, value: float, on_change: Optional[Callable] = None, min_val: Optional[float] = None, max_val: Optional[float] = None):
-        super().__init__(parent, label, on_change)
-        self.spinbox = ttk.Spinbox(self, from_=min_val if min_val is not None else -999999, to=max_val if max_val is not None else 999999, font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD))
+    def __init__(self, parent, label: str, value: float, on_change: Optional[Callable] = None, min_val: Optional[float] = None, max_val: Optional[float] = None,
+                 name: Optional[str] = None, integer: bool = False):
+        super().__init__(parent, label, on_change, name)
+        self.integer = integer
+        self.value = value
+        self.var = tk.StringVar(self, value=str(value) if value is not None else "0")
+        self.spinbox = ttk.Spinbox(self, from_=_NUM_BOUNDS[0] if min_val is None else min_val,
+                                   to=_NUM_BOUNDS[1] if max_val is None else max_val,
+                                   textvariable=self.var, font=ModernTheme.EDITOR_FONT)
         self.spinbox.pack(fill=tk.X)
-        self.spinbox.set(str(value) if value is not None else "0")
-        self.spinbox.bind('<KeyRelease>', self._on_change)
-        self.spinbox.bind('<<Increment>>', self._on_change)
-        self.spinbox.bind('<<Decrement>>', self._on_change)
+        # Arrow clicks write the variable too, so they are debounced like typing
+        self._bind_debounced(self.spinbox, self.var)
 
     def _on_change(self, event=None):
-        try:
-            val = float(self.spinbox.get())
-            self._trigger_change(val)
-        except ValueError:
-            pass
+        text = self.var.get().strip()
+        # Partial input such as "-" or "1e" is common while typing; skip it without raising
+        if not _NUMBER_RE.fullmatch(text):
+            return
+        val = float(text)
+        self._trigger_change(int(val) if self.integer else val)
+
+    def set_value(self, value: Any):
+        self.value = value
+        self.var.set(str(value) if value is not None else "0")
+        self._cancel_change()
 
 
 class ChoicePropertyEditor(PropertyEditor):
-    def __init__(self, parent, label: str, value: str, choices: List[str], on_change: Optional[Callable] = None):
-        super().__init__(parent, label, on_change)
-        self.choices = choices
-        self.combobox = ttk.Combobox(self, values=choices, state='readonly', font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD))
+    def __init__(self, parent, label: str, value: str, choices: Sequence[str], on_change: Optional[Callable] = None,
+                 name: Optional[str] = None):
+        super().__init__(parent, label, on_change, name)
+        self.choices = tuple(choices)
+        self.combobox = ttk.Combobox(self, values=self.choices, state='readonly', font=ModernTheme.EDITOR_FONT)
         self.combobox.pack(fill=tk.X)
-        if value in choices:
+        if value in self.choices:
+            self.combobox.set(value)
+        elif self.choices:
+            self.combobox.set(self.choices[0])
+        self.value = self.combobox.get()
+        self.combobox.bind('<<ComboboxSelected>>', self._on_select)
+
+    def _on_select(self, event=None):
+        self._trigger_change(self.combobox.get())
+
+    def set_value(self, value: Any):
+        if value in self.choices:
             self.combobox.set(value)
-        elif choices:
-            self.combobox.set(choices[0])
-        self.combobox.bind('<<ComboboxSelected>>', lambda e: self._trigger_change(self.combobox.get()))
+        elif self.choices:
+            self.combobox.set(self.choices[0])
+        self.value = self.combobox.get()
 
 
 class BooleanPropertyEditor(PropertyEditor):
-    def __init__(self, parent, label: str, value: bool, on_change: Optional[Callable] = None):
-        super().__init__(parent, "", on_change)
+    def __init__(self, parent, label: str, value: bool, on_change: Optional[Callable] = None,
+                 name: Optional[str] = None):
+        super().__init__(parent, "", on_change, name)
+        self.value = value
         self.var = tk.BooleanVar(value=value)
         self.checkbox = ttk.Checkbutton(self, text=label, variable=self.var, command=self._on_toggle, style='TCheckbutton')
         self.checkbox.pack(anchor=tk.W)
@@ -106,36 +230,44 @@ class BooleanPropertyEditor(PropertyEditor):
     def _on_toggle(self):
         self._trigger_change(self.var.get())
 
+    def set_value(self, value: Any):
+        self.value = bool(value)
+        self.var.set(self.value)
+
 
 class CoordinatePropertyEditor(PropertyEditor):
     def __init__(self, parent, label: str, x: int, y: int, on_change: Optional[Callable] = None):
         super().__init__(parent, label, on_change)
+        self.value = (x, y)
         coord_frame = ttk.Frame(self, style='TFrame')
         coord_frame.pack(fill=tk.X)
+        coord_frame.grid_columnconfigure((1, 3), weight=1)
+
+        ttk.Label(coord_frame, text="X:", style='Secondary.TLabel').grid(row=0, column=0)
+        self.x_var = tk.StringVar(self, value=str(x))
+        self.x_entry = ttk.Entry(coord_frame, textvariable=self.x_var, font=ModernTheme.EDITOR_FONT, width=8)
+        self.x_entry.grid(row=0, column=1, sticky='ew', padx=(0, ModernTheme.PADDING_SM))
+        self._bind_debounced(self.x_entry, self.x_var)
 
-        x_frame = ttk.Frame(coord_frame, style='TFrame')
-        x_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, ModernTheme.PADDING_SM))
-        ttk.Label(x_frame, text="X:", style='Secondary.TLabel').pack(side=tk.LEFT)
-        self.x_entry = ttk.Entry(x_frame, font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD), width=8)
-        self.x_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.x_entry.insert(0, str(x))
-        self.x_entry.bind('<KeyRelease>', self._on_change)
-
-        y_frame = ttk.Frame(coord_frame, style='TFrame')
-        y_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Label(y_frame, text="Y:", style='Secondary.TLabel').pack(side=tk.LEFT)
-        self.y_entry = ttk.Entry(y_frame, font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD), width=8)
-        self.y_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.y_entry.insert(0, str(y))
-        self.y_entry.bind('<KeyRelease>', self._on_change)
+        ttk.Label(coord_frame, text="Y:", style='Secondary.TLabel').grid(row=0, column=2)
+        self.y_var = tk.StringVar(self, value=str(y))
+        self.y_entry = ttk.Entry(coord_frame, textvariable=self.y_var, font=ModernTheme.EDITOR_FONT, width=8)
+        self.y_entry.grid(row=0, column=3, sticky='ew')
+        self._bind_debounced(self.y_entry, self.y_var)
 
     def _on_change(self, event=None):
         try:
-            x = int(self.x_entry.get())
-            y = int(self.y_entry.get())
-            self._trigger_change((x, y))
+            x = int(self.x_var.get())
+            y = int(self.y_var.get())
         except ValueError:
-            pass
+            return
+        self._trigger_change((x, y))
+
+    def set_value(self, value: Any):
+        self.value = tuple(value)
+        self.x_var.set(str(self.value[0]))
+        self.y_var.set(str(self.value[1]))
+        self._cancel_change()
 
 
 class CoordinateDisplayEditor(PropertyEditor):
@@ -144,21 +276,15 @@ class CoordinateDisplayEditor(PropertyEditor):
         super().__init__(parent, label, None)
         self.on_recapture = on_recapture
 
-        # Display frame
-        display_frame = ttk.Frame(self, style='TFrame')
-        display_frame.pack(fill=tk.X)
-
-        # Coordinates display (read-only)
-        info_frame = ttk.Frame(display_frame, style='TFrame')
-        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        self.coord_label = ttk.Label(info_frame, text=f"X: {x}, Y: {y}",
+        # Coordinates display (read-only), side by side with the button under the
+        # label; the packer fits both into the space below it without a row frame
+        self.coord_label = ttk.Label(self, text=f"X: {x}, Y: {y}",
                                      style='TLabel',
-                                     font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD))
-        self.coord_label.pack(anchor=tk.W)
+                                     font=ModernTheme.EDITOR_FONT)
+        self.coord_label.pack(side=tk.LEFT, fill=tk.X, expand=True, anchor=tk.W)
 
         # Recapture button
-        recapture_btn = ttk.Button(display_frame, text="📍 Recapture",
+        recapture_btn = ttk.Button(self, text="📍 Recapture",
                                    style='Outline.TButton',
                                    command=self._on_recapture_click)
         recapture_btn.pack(side=tk.RIGHT, padx=(ModernTheme.PADDING_SM, 0))
@@ -171,78 +297,205 @@ class CoordinateDisplayEditor(PropertyEditor):
         """Update displayed coordinates"""
         self.coord_label.config(text=f"X: {x}, Y: {y}")
 
+    def set_value(self, value: Any):
+        self.update_coordinates(*value)
+
 
 class MultilineTextPropertyEditor(PropertyEditor):
-    def __init__(self, parent, label: str, value: str, on_change: Optional[Callable] = None, height: int = 4):
-        super().__init__(parent, label, on_change)
-        self.text = tk.Text(self, font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_MD), height=height, wrap=tk.WORD, relief=tk.SOLID, borderwidth=1, highlightthickness=1, highlightcolor=ModernTheme.RING)
+    def __init__(self, parent, label: str, value: str, on_change: Optional[Callable] = None, height: int = 4,
+                 name: Optional[str] = None):
+        super().__init__(parent, label, on_change, name)
+        self.text = tk.Text(self, font=ModernTheme.EDITOR_FONT, height=height, wrap=tk.WORD, relief=tk.SOLID, borderwidth=1, highlightthickness=1, highlightcolor=ModernTheme.RING)
         self.text.pack(fill=tk.BOTH, expand=True)
-        self.text.insert('1.0', str(value) if value else "")
-        self.text.bind('<KeyRelease>', lambda e: self._trigger_change(self.text.get('1.0', 'end-1c')))
+        self.value = str(value) if value else ""
+        self.text.insert('1.0', self.value)
+        self.text.edit_modified(False)
+        self.text.bind('<KeyRelease>', self._schedule_change)
+        self.text.bind('<FocusOut>', self._flush_change)
+
+    def _on_change(self, event=None):
+        # Only copy the buffer out of Tk when an edit actually touched it
+        if not self.text.edit_modified():
+            return
+        self.text.edit_modified(False)
+        self._trigger_change(self.text.get('1.0', 'end-1c'))
+
+    def set_value(self, value: Any):
+        self.value = str(value) if value else ""
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', self.value)
+        self.text.edit_modified(False)
+        self._cancel_change()
 
 
 class ActionPropertyPanel(ttk.Frame):
-    def __init__(self, parent, action: EnhancedAction, on_change: Optional[Callable] = None,
+    """Property editors for one action at a time.
+
+    Editors are created on first use and kept in a pool keyed by property, so
+    selecting another action with set_action() only hides, shows and refills
+    existing widgets instead of rebuilding them.
+    """
+    def __init__(self, parent, action: Optional[EnhancedAction] = None, on_change: Optional[Callable] = None,
                  batch_columns: List[str] = None, on_recapture: Optional[Callable] = None):
         super().__init__(parent, style='TFrame')
         self.pack(fill=tk.BOTH, expand=True)
+        self.action = None
+        self.on_change = None
+        self.on_recapture = None
+        self.batch_columns = []
+        self._pool: Dict[str, PropertyEditor] = {}
+        self._shown: List[PropertyEditor] = []
+        self._keep_packed = False
+
+        self._create_common_properties()
+        if action is not None:
+            self.set_action(action, on_change, batch_columns, on_recapture)
+
+    def set_action(self, action: EnhancedAction, on_change: Optional[Callable] = None,
+                   batch_columns: List[str] = None, on_recapture: Optional[Callable] = None):
+        """Show the properties of action, reusing pooled editors where possible"""
+        # Deliver edits still waiting on the debounce timer to the previous action
+        self.enabled_editor._flush_change()
+        self.description_editor._flush_change()
+        for editor in self._shown:
+            editor._flush_change()
+
+        # Same type means the same editors in the same order, so they can stay packed
+        self._keep_packed = self.action is not None and self.action.type == action.type
         self.action = action
         self.on_change = on_change
         self.on_recapture = on_recapture
-        self.batch_columns = batch_columns if batch_columns is not None else []
-
-        self._create_common_properties()
+        batch_columns = list(batch_columns) if batch_columns is not None else []
+        if bool(batch_columns) != bool(self.batch_columns):
+            # Text editors only build a column picker when there are columns, so start over
+            for editor in self._pool.values():
+                editor.destroy()
+            self._pool.clear()
+            self._shown = []
+        # Pickers share this list and read it when opened, so update it in place
+        self.batch_columns[:] = batch_columns
+
+        self.enabled_editor.set_value(action.enabled)
+        self.description_editor.set_value(action.params.get('description', ''))
+
+        if not self._keep_packed:
+            for editor in self._shown:
+                editor.pack_forget()
+        self._shown = []
         self._create_type_specific_properties()
 
+    def ensure_editor(self, key: str, value: Any, editor_cls: type, *args, **kwargs) -> PropertyEditor:
+        """Show the pooled editor for key holding value, creating editor_cls(self, *args, **kwargs) on first use"""
+        editor = self._pool.get(key)
+        if editor is None:
+            editor = self._pool[key] = editor_cls(self, *args, **kwargs)
+        else:
+            editor.set_value(value)
+            if not self._keep_packed:
+                editor.pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
+        self._shown.append(editor)
+        return editor
+
     def _create_common_properties(self):
-        BooleanPropertyEditor(self, "Enabled", self.action.enabled, on_change=lambda v: self._on_property_change('enabled', v))
-        ttk.Separator(self, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
-        MultilineTextPropertyEditor(self, "Description", self.action.params.get('description', ''), on_change=lambda v: self._on_property_change('description', v), height=3)
-        ttk.Separator(self, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
+        self.enabled_editor = BooleanPropertyEditor(self, "Enabled", True, on_change=self._on_property_change, name='enabled')
+        ttk.Frame(self, height=1, style='Separator.TFrame').pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
+        self.description_editor = MultilineTextPropertyEditor(self, "Description", '', on_change=self._on_property_change, height=3, name='description')
+        ttk.Frame(self, height=1, style='Separator.TFrame').pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
 
     def _create_type_specific_properties(self):
-        action_type = self.action.type
-        params = self.action.params
-
-        if action_type == 'click':
-            CoordinateDisplayEditor(self, "Position", params.get('x', 0), params.get('y', 0),
-                                  on_recapture=lambda: self._on_recapture_position())
-
-        if action_type == 'move_mouse':
-            CoordinatePropertyEditor(self, "Position", params.get('x', 0), params.get('y', 0), on_change=lambda v: self._on_coords_change(v))
-
-        if action_type == 'type':
-            HybridTextPropertyEditor(self, "Text to Type", params.get('text', ''), self.batch_columns, on_change=lambda v: self._on_property_change('text', v))
-
-        if action_type == 'set_value':
-            CoordinateDisplayEditor(self, "Position", params.get('x', 0), params.get('y', 0),
-                                  on_recapture=lambda: self._on_recapture_position())
-            HybridTextPropertyEditor(self, "Value", params.get('value', ''), self.batch_columns, on_change=lambda v: self._on_property_change('value', v))
-            ChoicePropertyEditor(self, "Clear Method", params.get('method', 'ctrl_a'), ['ctrl_a', 'backspace', 'triple_click'], on_change=lambda v: self._on_property_change('method', v))
-
-        if action_type == 'wait':
-            wait_type = params.get('wait_type', 'duration')
-            ChoicePropertyEditor(self, "Wait Type", wait_type, ['duration', 'image'], on_change=lambda v: self._on_property_change('wait_type', v))
-            if wait_type == 'duration':
-                NumberPropertyEditor(self, "Duration (s)", params.get('duration', 1.0), on_change=lambda v: self._on_property_change('duration', v), min_val=0.1, max_val=300.0)
-
-        if action_type == 'scroll':
-            scroll_type = params.get('scroll_type', 'amount')
-            ChoicePropertyEditor(self, "Scroll Type", scroll_type, ['amount', 'top', 'bottom'], on_change=lambda v: self._on_property_change('scroll_type', v))
-            if scroll_type == 'amount':
-                NumberPropertyEditor(self, "Amount", params.get('amount', -300), on_change=lambda v: self._on_property_change('amount', int(v)), min_val=-5000, max_val=5000)
-
-        if action_type == 'find_image':
-            TextPropertyEditor(self, "Image Name", params.get('image_name', ''), on_change=lambda v: self._on_property_change('image_name', v))
-            NumberPropertyEditor(self, "Confidence", params.get('confidence', 0.8), on_change=lambda v: self._on_property_change('confidence', v), min_val=0.1, max_val=1.0)
-
-        if action_type == 'delete':
-            ChoicePropertyEditor(self, "Delete Method", params.get('method', 'ctrl_a'), ['ctrl_a', 'backspace', 'triple_click'], on_change=lambda v: self._on_property_change('method', v))
+        builder = self._TYPE_BUILDERS.get(self.action.type)
+        if builder:
+            builder(self, self.action.params)
+
+    def _build_click(self, params):
+        x, y = params.get('x', 0), params.get('y', 0)
+        self.ensure_editor('position', (x, y), CoordinateDisplayEditor,
+            "Position", x, y, on_recapture=self._on_recapture_position)
+
+    def _build_move_mouse(self, params):
+        x, y = params.get('x', 0), params.get('y', 0)
+        self.ensure_editor('position_edit', (x, y), CoordinatePropertyEditor,
+            "Position", x, y, on_change=self._on_coords_change)
+
+    def _build_type(self, params):
+        text = params.get('text', '')
+        self.ensure_editor('text', text, HybridTextPropertyEditor,
+            "Text to Type", text, self.batch_columns, on_change=self._on_property_change, name='text')
+
+    def _build_set_value(self, params):
+        self._build_click(params)
+        value = params.get('value', '')
+        self.ensure_editor('value', value, HybridTextPropertyEditor,
+            "Value", value, self.batch_columns, on_change=self._on_property_change, name='value')
+        method = params.get('method', 'ctrl_a')
+        self.ensure_editor('clear_method', method, ChoicePropertyEditor,
+            "Clear Method", method, CLEAR_METHODS, on_change=self._on_property_change, name='method')
+
+    def _build_wait(self, params):
+        wait_type = params.get('wait_type', 'duration')
+        self.ensure_editor('wait_type', wait_type, ChoicePropertyEditor,
+            "Wait Type", wait_type, WAIT_TYPES, on_change=self._on_subtype_change, name='wait_type')
+        duration = params.get('duration', 1.0)
+        self.ensure_editor('duration', duration, NumberPropertyEditor,
+            "Duration (s)", duration, on_change=self._on_property_change, min_val=0.1, max_val=300.0, name='duration')
+        self._toggle_sub_editor('wait_type', wait_type)
+
+    def _build_scroll(self, params):
+        scroll_type = params.get('scroll_type', 'amount')
+        self.ensure_editor('scroll_type', scroll_type, ChoicePropertyEditor,
+            "Scroll Type", scroll_type, SCROLL_TYPES, on_change=self._on_subtype_change, name='scroll_type')
+        amount = params.get('amount', -300)
+        self.ensure_editor('amount', amount, NumberPropertyEditor,
+            "Amount", amount, on_change=self._on_property_change, min_val=-5000, max_val=5000, name='amount', integer=True)
+        self._toggle_sub_editor('scroll_type', scroll_type)
+
+    # Type selector -> (dependent editor key, selector value that shows it)
+    _SUB_EDITORS = {
+        'wait_type': ('duration', 'duration'),
+        'scroll_type': ('amount', 'amount'),
+    }
+
+    def _toggle_sub_editor(self, selector: str, value: str):
+        """Show or hide the editor that only applies to one selector value"""
+        key, shown_for = self._SUB_EDITORS[selector]
+        editor = self._pool[key]
+        if value == shown_for:
+            # Sub-editors are built last, so packing at the end keeps the order
+            editor.pack(fill=tk.X, pady=ModernTheme.PADDING_MD)
+        else:
+            editor.pack_forget()
+
+    def _on_subtype_change(self, property_name: str, value: Any):
+        self._toggle_sub_editor(property_name, value)
+        self._on_property_change(property_name, value)
+
+    def _build_find_image(self, params):
+        image_name = params.get('image_name', '')
+        self.ensure_editor('image_name', image_name, TextPropertyEditor,
+            "Image Name", image_name, on_change=self._on_property_change, name='image_name')
+        confidence = params.get('confidence', 0.8)
+        self.ensure_editor('confidence', confidence, NumberPropertyEditor,
+            "Confidence", confidence, on_change=self._on_property_change, min_val=0.1, max_val=1.0, name='confidence')
+
+    def _build_delete(self, params):
+        method = params.get('method', 'ctrl_a')
+        self.ensure_editor('delete_method', method, ChoicePropertyEditor,
+            "Delete Method", method, CLEAR_METHODS, on_change=self._on_property_change, name='method')
+
+    # Action type -> builder function, called as builder(self, params)
+    _TYPE_BUILDERS = {
+        'click': _build_click,
+        'move_mouse': _build_move_mouse,
+        'type': _build_type,
+        'set_value': _build_set_value,
+        'wait': _build_wait,
+        'scroll': _build_scroll,
+        'find_image': _build_find_image,
+        'delete': _build_delete,
+    }
 
     def _on_coords_change(self, coords: tuple):
-        x, y = coords
-        self._on_property_change('x', x)
-        self._on_property_change('y', y)
+        self._on_property_change('position', coords)
 
     def _on_recapture_position(self):
         """Trigger position recapture callback"""
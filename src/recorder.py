@@ -1,12 +1,11 @@
 """
 Action recording functionality
 """
-import pyautogui
 import time
 import logging
 from typing import Dict, Any, List, Optional, Callable
-from PIL import ImageGrab
 from pathlib import Path
+from pynput import mouse
 
 
 class ActionRecorder:
@@ -23,6 +22,12 @@ class ActionRecorder:
         self.actions = actions
         self.images_dir = Path(images_dir)
         self.images_dir.mkdir(exist_ok=True)
+        self._mouse = mouse.Controller()
+
+    def _cursor_position(self):
+        """Current cursor position as integer screen coordinates"""
+        x, y = self._mouse.position
+        return int(x), int(y)
 
     def record_click(self, description: str = "", wait_after: float = 1.0,
                     use_current: bool = False) -> Dict[str, Any]:
@@ -38,11 +43,11 @@ class ActionRecorder:
             Created action dictionary
         """
         if use_current:
-            x, y = pyautogui.position()
+            x, y = self._cursor_position()
         else:
             logging.info("Move mouse to position and click...")
             time.sleep(2)
-            x, y = pyautogui.position()
+            x, y = self._cursor_position()
 
         action = {
             "type": "click",
@@ -192,12 +197,13 @@ class ActionRecorder:
         time.sleep(delay)
 
         # Get mouse position
-        x, y = pyautogui.position()
+        x, y = self._cursor_position()
 
         # Capture region around cursor (100x100 box)
         region = (x - 50, y - 50, x + 50, y + 50)
 
         try:
+            from PIL import ImageGrab
             screenshot = ImageGrab.grab(bbox=region)
 
             # Generate filename
@@ -205,7 +211,8 @@ class ActionRecorder:
             filename = f"capture_{timestamp}.png"
             filepath = self.images_dir / filename
 
-            screenshot.save(str(filepath))
+            # Fast zlib level: captures are small and written while the caller waits
+            screenshot.save(str(filepath), compress_level=1)
             logging.info(f"Saved capture to {filepath}")
 
             return str(filepath)
@@ -89,25 +89,31 @@ class RecordingManager:
 
         # Add recorded actions to workflow
         if recorded_actions:
-            for action in recorded_actions:
-                self.app.actions.append(action)
+            first_new_index = len(self.app.actions)
+            self.app.actions.extend(recorded_actions)
 
-            self.app._refresh_workflow()
+            self.app._append_to_workflow(first_new_index)
 
             # Load first screenshot if this is the first set of actions
+            screenshot_loaded = False
             if len(recorded_actions) > 0 and recorded_actions[0].has_visual_data():
                 if not self.app.visual_canvas.has_screenshot():
                     from PIL import Image
                     try:
                         screenshot = Image.open(recorded_actions[0].visual.screenshot_path)
                         self.app.visual_canvas.load_screenshot(screenshot)
+                        screenshot_loaded = True
                     except:
                         pass
 
-            # Add all annotations
-            for i, action in enumerate(self.app.actions):
-                if action.has_visual_data():
-                    self.app._add_canvas_annotation(action, i)
+            if screenshot_loaded:
+                # Loading a screenshot clears the canvas, so draw every annotation
+                self.app._redraw_canvas_annotations()
+            else:
+                # Existing annotations are still on the canvas; only add the new ones
+                for i, action in enumerate(recorded_actions, start=first_new_index):
+                    if action.has_visual_data():
+                        self.app._add_canvas_annotation(action, i)
 
             messagebox.showinfo("Recording Complete",
                               f"Recorded {len(recorded_actions)} action{'s' if len(recorded_actions) != 1 else ''}!\n\n" +
@@ -7,6 +7,30 @@ from tkinter import ttk
 from typing import Optional, Callable
 from src.theme import ModernTheme, Icons
 
+# Dark recording palette shared by the overlay and the control panel
+PANEL_BG = '#2d2d2d'
+COUNTER_BG = '#3d3d3d'
+DOT_RED = '#ff4444'
+DOT_RED_DIM = '#ff8888'
+DOT_PAUSED = '#ffaa00'
+COUNT_GREEN = '#4CAF50'
+COUNT_FLASH = '#8BC34A'
+TEXT_LIGHT = '#cccccc'
+TEXT_HINT = '#888888'
+BUTTON_BG = '#555555'
+BUTTON_ACTIVE = '#666666'
+STOP_BG = '#d32f2f'
+STOP_ACTIVE = '#b71c1c'
+
+# Font specs, built once at import rather than per widget
+TITLE_FONT = (ModernTheme.FONT_FAMILY, 12, 'bold')
+COUNT_FONT = (ModernTheme.FONT_FAMILY, 14, 'bold')
+START_FONT = (ModernTheme.FONT_FAMILY, 11, 'bold')
+STATUS_FONT = (ModernTheme.FONT_FAMILY, 10, 'bold')
+BUTTON_FONT = (ModernTheme.FONT_FAMILY, 10)
+BODY_FONT = (ModernTheme.FONT_FAMILY, 9)
+HINT_FONT = (ModernTheme.FONT_FAMILY, 8)
+
 
 class RecordingOverlay:
     """Floating overlay showing recording status"""
@@ -45,6 +69,10 @@ class RecordingOverlay:
         # State
         self.is_paused = False
         self.action_count = 0
+        self._dot_bright = True
+        self._anim_after_id = None
+        self._flash_after_id = None
+        self._count_after_id = None
 
         # Create UI
         self._create_ui()
@@ -56,46 +84,48 @@ class RecordingOverlay:
     def _create_ui(self):
         """Create overlay UI"""
         # Main container
-        container = tk.Frame(self.window, bg='#2d2d2d', padx=15, pady=15)
+        container = tk.Frame(self.window, bg=PANEL_BG, padx=15, pady=15)
         container.pack(fill=tk.BOTH, expand=True)
 
         # Header with recording indicator
-        header = tk.Frame(container, bg='#2d2d2d')
+        header = tk.Frame(container, bg=PANEL_BG)
         header.pack(fill=tk.X, pady=(0, 10))
 
         # Recording dot (animated)
-        self.recording_dot = tk.Label(header, text="●", font=('Arial', 20),
-                                     fg='#ff4444', bg='#2d2d2d')
-        self.recording_dot.pack(side=tk.LEFT, padx=(0, 10))
+        # Drawn as a canvas oval so blinking is an item fill change, not a label re-layout
+        self._dot_canvas = tk.Canvas(header, width=24, height=24, bg=PANEL_BG,
+                                     highlightthickness=0)
+        self._dot_id = self._dot_canvas.create_oval(4, 4, 20, 20, fill=DOT_RED, outline='')
+        self._dot_canvas.pack(side=tk.LEFT, padx=(0, 10))
 
         # Status label
         self.status_label = tk.Label(header, text="RECORDING",
-                                     font=(ModernTheme.FONT_FAMILY, 12, 'bold'),
-                                     fg='white', bg='#2d2d2d')
+                                     font=TITLE_FONT,
+                                     fg='white', bg=PANEL_BG)
         self.status_label.pack(side=tk.LEFT)
 
         # Action counter
-        counter_frame = tk.Frame(container, bg='#3d3d3d', padx=10, pady=8)
+        counter_frame = tk.Frame(container, bg=COUNTER_BG, padx=10, pady=8)
         counter_frame.pack(fill=tk.X, pady=(0, 15))
 
         tk.Label(counter_frame, text="Actions Recorded:",
-                font=(ModernTheme.FONT_FAMILY, 9),
-                fg='#cccccc', bg='#3d3d3d').pack(side=tk.LEFT)
+                font=BODY_FONT,
+                fg=TEXT_LIGHT, bg=COUNTER_BG).pack(side=tk.LEFT)
 
         self.count_label = tk.Label(counter_frame, text="0",
-                                    font=(ModernTheme.FONT_FAMILY, 14, 'bold'),
-                                    fg='#4CAF50', bg='#3d3d3d')
+                                    font=COUNT_FONT,
+                                    fg=COUNT_GREEN, bg=COUNTER_BG)
         self.count_label.pack(side=tk.RIGHT)
 
         # Control buttons
-        controls = tk.Frame(container, bg='#2d2d2d')
+        controls = tk.Frame(container, bg=PANEL_BG)
         controls.pack(fill=tk.X)
 
         # Pause/Resume button
         self.pause_btn = tk.Button(controls, text="⏸ Pause",
-                                   font=(ModernTheme.FONT_FAMILY, 10),
-                                   bg='#555555', fg='white',
-                                   activebackground='#666666',
+                                   font=BUTTON_FONT,
+                                   bg=BUTTON_BG, fg='white',
+                                   activebackground=BUTTON_ACTIVE,
                                    relief=tk.FLAT, padx=15, pady=8,
                                    cursor='hand2',
                                    command=self._on_pause_resume_click)
@@ -103,9 +133,9 @@ class RecordingOverlay:
 
         # Stop button
         stop_btn = tk.Button(controls, text="⏹ Stop",
-                            font=(ModernTheme.FONT_FAMILY, 10),
-                            bg='#d32f2f', fg='white',
-                            activebackground='#b71c1c',
+                            font=BUTTON_FONT,
+                            bg=STOP_BG, fg='white',
+                            activebackground=STOP_ACTIVE,
                             relief=tk.FLAT, padx=15, pady=8,
                             cursor='hand2',
                             command=self._on_stop_click)
@@ -113,24 +143,29 @@ class RecordingOverlay:
 
         # Hotkey hint
         hint = tk.Label(container, text="Hotkeys: P = Pause/Resume, S = Stop",
-                       font=(ModernTheme.FONT_FAMILY, 8),
-                       fg='#888888', bg='#2d2d2d')
+                       font=HINT_FONT,
+                       fg=TEXT_HINT, bg=PANEL_BG)
         hint.pack(pady=(10, 0))
 
         # Start animation
-        self._animate_recording_dot()
+        self._start_animation()
 
-    def _animate_recording_dot(self):
-        """Animate recording dot"""
-        if not self.window.winfo_exists():
-            return
+    def _start_animation(self):
+        """Start blinking the recording dot unless it is already running"""
+        if self._anim_after_id is None:
+            self._anim_after_id = self.window.after(500, self._animate_recording_dot)
 
-        if not self.is_paused:
-            current_fg = self.recording_dot.cget('fg')
-            new_fg = '#ff4444' if current_fg == '#ff8888' else '#ff8888'
-            self.recording_dot.config(fg=new_fg)
+    def _stop_animation(self):
+        """Stop blinking so a hidden or paused overlay causes no timer wakeups"""
+        if self._anim_after_id is not None:
+            self.window.after_cancel(self._anim_after_id)
+            self._anim_after_id = None
 
-        self.window.after(500, self._animate_recording_dot)
+    def _animate_recording_dot(self):
+        """Animate recording dot"""
+        self._dot_bright = not self._dot_bright
+        self._dot_canvas.itemconfig(self._dot_id, fill=DOT_RED if self._dot_bright else DOT_RED_DIM)
+        self._anim_after_id = self.window.after(500, self._animate_recording_dot)
 
     def _on_pause_resume_click(self):
         """Handle pause/resume button click"""
@@ -148,38 +183,66 @@ class RecordingOverlay:
 
     def set_paused(self, paused: bool):
         """Set paused state"""
+        if paused == self.is_paused:
+            return
         self.is_paused = paused
 
         if paused:
+            self._stop_animation()
             self.status_label.config(text="PAUSED")
-            self.recording_dot.config(fg='#ffaa00')
-            self.pause_btn.config(text="▶ Resume", bg='#4CAF50')
+            self._dot_canvas.itemconfig(self._dot_id, fill=DOT_PAUSED)
+            self.pause_btn.config(text="▶ Resume", bg=COUNT_GREEN)
         else:
             self.status_label.config(text="RECORDING")
-            self.recording_dot.config(fg='#ff4444')
-            self.pause_btn.config(text="⏸ Pause", bg='#555555')
+            self._dot_bright = True
+            self._dot_canvas.itemconfig(self._dot_id, fill=DOT_RED)
+            self.pause_btn.config(text="⏸ Pause", bg=BUTTON_BG)
+            self._start_animation()
 
     def update_count(self, count: int):
         """Update action count"""
+        if count == self.action_count:
+            return
         self.action_count = count
-        self.count_label.config(text=str(count))
+        # A burst of recorded actions only redraws the counter once, when Tk is idle
+        if self._count_after_id is None:
+            self._count_after_id = self.window.after_idle(self._apply_count)
 
-        # Flash the counter
-        self.count_label.config(fg='#8BC34A')
-        self.window.after(200, lambda: self.count_label.config(fg='#4CAF50'))
+    def _apply_count(self):
+        self._count_after_id = None
+        self.count_label.config(text=str(self.action_count))
+
+        # Flash the counter; rapid updates extend one flash instead of queueing restores
+        if self._flash_after_id is None:
+            self.count_label.config(fg=COUNT_FLASH)
+        else:
+            self.window.after_cancel(self._flash_after_id)
+        self._flash_after_id = self.window.after(200, self._end_count_flash)
+
+    def _end_count_flash(self):
+        self._flash_after_id = None
+        self.count_label.config(fg=COUNT_GREEN)
 
     def show(self):
         """Show overlay"""
         self.window.deiconify()
         self.window.lift()
         self.window.attributes('-topmost', True)
+        if not self.is_paused:
+            self._start_animation()
 
     def hide(self):
         """Hide overlay"""
+        self._stop_animation()
         self.window.withdraw()
 
     def destroy(self):
         """Destroy overlay"""
+        self._stop_animation()
+        for after_id in (self._flash_after_id, self._count_after_id):
+            if after_id is not None:
+                self.window.after_cancel(after_id)
+        self._flash_after_id = self._count_after_id = None
         if self.window.winfo_exists():
             self.window.destroy()
 
@@ -207,6 +270,8 @@ class RecordingControlPanel:
         # Create frame
         self.frame = tk.Frame(parent, bg=ModernTheme.BACKGROUND)
         self.is_recording = False
+        self.is_paused = False
+        self.action_count = 0
 
         self._create_ui()
 
@@ -214,45 +279,45 @@ class RecordingControlPanel:
         """Create control panel UI"""
         # Title
         title = tk.Label(self.frame, text="Recording Controls",
-                        font=(ModernTheme.FONT_FAMILY, 12, 'bold'),
+                        font=TITLE_FONT,
                         bg=ModernTheme.BACKGROUND, fg=ModernTheme.FOREGROUND)
         title.pack(pady=(0, 10))
 
         # Info
         info = tk.Label(self.frame,
                        text="Record your actions automatically\nClicks, typing, and scrolling will be captured",
-                       font=(ModernTheme.FONT_FAMILY, 9),
+                       font=BODY_FONT,
                        bg=ModernTheme.BACKGROUND, fg=ModernTheme.MUTED_FOREGROUND,
                        justify=tk.LEFT)
         info.pack(pady=(0, 15))
 
         # Start button
         self.start_btn = tk.Button(self.frame, text="🔴 Start Recording",
-                                   font=(ModernTheme.FONT_FAMILY, 11, 'bold'),
-                                   bg='#d32f2f', fg='white',
-                                   activebackground='#b71c1c',
+                                   font=START_FONT,
+                                   bg=STOP_BG, fg='white',
+                                   activebackground=STOP_ACTIVE,
                                    relief=tk.FLAT, padx=20, pady=12,
                                    cursor='hand2',
                                    command=self._on_start_click)
         self.start_btn.pack(fill=tk.X)
 
         # Recording status (hidden initially)
-        self.status_frame = tk.Frame(self.frame, bg='#2d2d2d', padx=15, pady=15)
+        self.status_frame = tk.Frame(self.frame, bg=PANEL_BG, padx=15, pady=15)
 
         status_label = tk.Label(self.status_frame, text="● Recording in progress...",
-                               font=(ModernTheme.FONT_FAMILY, 10, 'bold'),
-                               bg='#2d2d2d', fg='#ff4444')
+                               font=STATUS_FONT,
+                               bg=PANEL_BG, fg=DOT_RED)
         status_label.pack(pady=(0, 10))
 
         self.action_count_label = tk.Label(self.status_frame, text="0 actions recorded",
-                                           font=(ModernTheme.FONT_FAMILY, 9),
-                                           bg='#2d2d2d', fg='#cccccc')
+                                           font=BODY_FONT,
+                                           bg=PANEL_BG, fg=TEXT_LIGHT)
         self.action_count_label.pack(pady=(0, 10))
 
         # Pause button
         self.pause_btn = tk.Button(self.status_frame, text="⏸ Pause",
-                                   font=(ModernTheme.FONT_FAMILY, 10),
-                                   bg='#555555', fg='white',
+                                   font=BUTTON_FONT,
+                                   bg=BUTTON_BG, fg='white',
                                    relief=tk.FLAT, padx=15, pady=8,
                                    cursor='hand2',
                                    command=self._on_pause_click)
@@ -260,8 +325,8 @@ class RecordingControlPanel:
 
         # Stop button
         stop_btn = tk.Button(self.status_frame, text="⏹ Stop Recording",
-                            font=(ModernTheme.FONT_FAMILY, 10),
-                            bg='#d32f2f', fg='white',
+                            font=BUTTON_FONT,
+                            bg=STOP_BG, fg='white',
                             relief=tk.FLAT, padx=15, pady=8,
                             cursor='hand2',
                             command=self._on_stop_click)
@@ -296,14 +361,20 @@ class RecordingControlPanel:
 
     def update_count(self, count: int):
         """Update action count"""
+        if count == self.action_count:
+            return
+        self.action_count = count
         self.action_count_label.config(text=f"{count} action{'s' if count != 1 else ''} recorded")
 
     def set_paused(self, paused: bool):
         """Set paused state"""
+        if paused == self.is_paused:
+            return
+        self.is_paused = paused
         if paused:
-            self.pause_btn.config(text="▶ Resume", bg='#4CAF50')
+            self.pause_btn.config(text="▶ Resume", bg=COUNT_GREEN)
         else:
-            self.pause_btn.config(text="⏸ Pause", bg='#555555')
+            self.pause_btn.config(text="⏸ Pause", bg=BUTTON_BG)
 
     def pack(self, **kwargs):
         """Pack the frame"""
@@ -4,17 +4,47 @@ Handles screen capture, thumbnail generation, and image storage
 """
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Callable
+import mss
 import pyautogui
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import logging
 
+# Annotation fonts by size; truetype() re-reads and parses the font file each call
+_FONT_CACHE: Dict[int, ImageFont.ImageFont] = {}
+
+
+def _get_font(size: int = 14) -> ImageFont.ImageFont:
+    """Return the annotation font at the given size, loading it once"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype("arial.ttf", size)
+        except:
+            font = ImageFont.load_default()
+        _FONT_CACHE[size] = font
+    return font
+
 
 class ScreenshotManager:
     """Manages screenshot capture, storage, and thumbnail generation"""
 
+    # zlib level for captures saved while recording; PNG stays lossless at any
+    # level, and level 1 encodes a full screen several times faster than the default 6
+    CAPTURE_COMPRESS_LEVEL = 1
+
+    # Thumbnails and previews are only ever looked at, never matched against,
+    # so they are written as JPEG rather than lossless PNG
+    THUMBNAIL_QUALITY = 85
+
+    # Filename numbers are reserved on disk this many at a time, so the counter
+    # file is rewritten once per block rather than once per capture
+    COUNTER_BLOCK = 50
+
     def __init__(self, base_dir: str = "screenshots"):
         """
         Initialize screenshot manager
@@ -30,8 +60,23 @@ class ScreenshotManager:
         # Create directories
         self._ensure_directories()
 
-        # Counter for generating unique filenames
+        # Counter for generating unique filenames; captures may reserve names
+        # from the recorder's listener thread while the UI thread does the same
+        self._counter_path = self.base_dir / ".counter"
         self.counter = self._get_next_counter()
+        self._counter_reserved = self.counter
+        self._counter_lock = threading.Lock()
+
+        # Background PNG encoding; captures return their paths before the files
+        # are written (see wait_for_pending_saves)
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._writer_lock = threading.Lock()
+        self._pending_saves = []
+
+        # mss handles are not thread-safe; the UI and listener threads each get
+        # one, keyed by thread ident so release_grabber() can close it later
+        self._grabbers = {}
+        self._grabbers_lock = threading.Lock()
 
     def _ensure_directories(self):
         """Ensure all required directories exist"""
@@ -41,7 +86,14 @@ class ScreenshotManager:
 
     def _get_next_counter(self) -> int:
         """Get next available counter for unique filenames"""
+        try:
+            return int(self._counter_path.read_text())
+        except (OSError, ValueError):
+            pass
+
+        # No counter file yet: scan what earlier sessions left behind
         existing_files = list(self.screenshots_dir.glob("action_*.png"))
+        existing_files.extend(self.regions_dir.glob("region_*.png"))
         if not existing_files:
             return 1
 
@@ -56,16 +108,93 @@ class ScreenshotManager:
 
         return max(numbers, default=0) + 1
 
+    def _reserve_counter_block(self):
+        """Record on disk that numbers up to the next block may be in use"""
+        self._counter_reserved = self.counter + self.COUNTER_BLOCK
+        tmp_path = self._counter_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(str(self._counter_reserved))
+            os.replace(tmp_path, self._counter_path)
+        except OSError as e:
+            logging.warning(f"Could not save screenshot counter: {str(e)}")
+
     def _generate_filename(self, prefix: str = "action") -> str:
         """Generate unique filename"""
-        filename = f"{prefix}_{self.counter:04d}.png"
-        self.counter += 1
+        with self._counter_lock:
+            if self.counter >= self._counter_reserved:
+                self._reserve_counter_block()
+            filename = f"{prefix}_{self.counter:04d}.png"
+            self.counter += 1
         return filename
 
+    def _grab(self, region: Optional[Tuple[int, int, int, int]] = None) -> Image.Image:
+        """
+        Grab the primary monitor, or a (left, top, width, height) region of it
+
+        mss keeps its capture buffer between calls, and the BGRX pixels are
+        decoded straight into the PIL image without an intermediate RGB copy.
+        A region reaching past the monitor edge is grabbed clamped and padded
+        with black back to the requested size, as Image.crop() would.
+        """
+        ident = threading.get_ident()
+        sct = self._grabbers.get(ident)
+        if sct is None:
+            sct = mss.mss()
+            with self._grabbers_lock:
+                self._grabbers[ident] = sct
+
+        screen = sct.monitors[1]
+        if region is None:
+            raw = sct.grab(screen)
+            return Image.frombytes('RGB', raw.size, raw.bgra, 'raw', 'BGRX')
+
+        left, top, width, height = region
+        # mss fails on X11 when asked for pixels outside the screen
+        x0 = max(left, screen['left'])
+        y0 = max(top, screen['top'])
+        x1 = min(left + width, screen['left'] + screen['width'])
+        y1 = min(top + height, screen['top'] + screen['height'])
+        if x1 <= x0 or y1 <= y0:
+            return Image.new('RGB', (width, height))
+
+        raw = sct.grab({'left': x0, 'top': y0, 'width': x1 - x0, 'height': y1 - y0})
+        image = Image.frombytes('RGB', raw.size, raw.bgra, 'raw', 'BGRX')
+        if image.size != (width, height):
+            padded = Image.new('RGB', (width, height))
+            padded.paste(image, (x0 - left, y0 - top))
+            image = padded
+        return image
+
+    def release_grabber(self, thread: threading.Thread):
+        """Close the mss handle a finished thread grabbed with (an X connection on Linux)"""
+        with self._grabbers_lock:
+            sct = self._grabbers.pop(thread.ident, None)
+        if sct is not None:
+            sct.close()
+
+    def _submit_save(self, fn: Callable, *args):
+        """Queue fn(*args) on the single background writer thread"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+            self._pending_saves = [f for f in self._pending_saves if not f.done()]
+            self._pending_saves.append(self._writer.submit(fn, *args))
+
+    def _save_png(self, img: Image.Image, filepath: Path):
+        """Write a capture PNG (writer thread)"""
+        try:
+            img.save(str(filepath), 'PNG', compress_level=self.CAPTURE_COMPRESS_LEVEL)
+            logging.info(f"Screenshot saved: {filepath}")
+        except Exception as e:
+            logging.error(f"Error saving {filepath}: {str(e)}")
+
     def capture_full_screen(self, delay: float = 0.0) -> str:
         """
         Capture full screen
 
+        The PNG is written in the background; call wait_for_pending_saves()
+        before reading it.
+
         Args:
             delay: Delay before capture in seconds
 
@@ -77,14 +206,13 @@ class ScreenshotManager:
 
         try:
             # Capture screenshot
-            screenshot = pyautogui.screenshot()
+            screenshot = self._grab()
 
             # Save full screenshot
             filename = self._generate_filename()
             filepath = self.screenshots_dir / filename
 
-            screenshot.save(str(filepath), 'PNG')
-            logging.info(f"Full screen captured: {filepath}")
+            self._submit_save(self._save_png, screenshot, filepath)
 
             return str(filepath)
 
@@ -93,16 +221,21 @@ class ScreenshotManager:
             return ""
 
     def capture_region(self, x: int, y: int, width: int, height: int,
-                      delay: float = 0.0) -> Tuple[str, str]:
+                      delay: float = 0.0, save_full: bool = True) -> Tuple[str, str]:
         """
         Capture specific screen region
 
+        The region file is written before returning; the full screenshot is
+        written in the background (see wait_for_pending_saves).
+
         Args:
             x: X coordinate of top-left corner
             y: Y coordinate of top-left corner
             width: Width of region
             height: Height of region
             delay: Delay before capture in seconds
+            save_full: Also save the full screenshot; when False only the
+                region is grabbed and the full path is returned as ""
 
         Returns:
             Tuple of (full_screenshot_path, region_screenshot_path)
@@ -111,19 +244,24 @@ class ScreenshotManager:
             time.sleep(delay)
 
         try:
-            # Capture full screen first
-            full_screenshot = pyautogui.screenshot()
+            full_filepath = ""
+            if save_full:
+                # Capture full screen first
+                full_screenshot = self._grab()
 
-            # Save full screenshot
-            full_filename = self._generate_filename()
-            full_filepath = self.screenshots_dir / full_filename
-            full_screenshot.save(str(full_filepath), 'PNG')
+                # Save full screenshot
+                full_filename = self._generate_filename()
+                full_filepath = self.screenshots_dir / full_filename
+                self._submit_save(self._save_png, full_screenshot, full_filepath)
+
+                region = full_screenshot.crop((x, y, x + width, y + height))
+            else:
+                region = self._grab((x, y, width, height))
 
-            # Extract and save region
-            region = full_screenshot.crop((x, y, x + width, y + height))
+            # Save region
             region_filename = self._generate_filename("region")
             region_filepath = self.regions_dir / region_filename
-            region.save(str(region_filepath), 'PNG')
+            region.save(str(region_filepath), 'PNG', compress_level=self.CAPTURE_COMPRESS_LEVEL)
 
             logging.info(f"Region captured: {region_filepath}")
 
@@ -134,7 +272,8 @@ class ScreenshotManager:
             return "", ""
 
     def capture_point_with_context(self, x: int, y: int, context_size: int = 100,
-                                   delay: float = 0.0) -> Tuple[str, str, Dict[str, int]]:
+                                   delay: float = 0.0, save_full: bool = True
+                                   ) -> Tuple[str, str, Dict[str, int]]:
         """
         Capture a point with surrounding context
 
@@ -143,6 +282,7 @@ class ScreenshotManager:
             y: Y coordinate
             context_size: Size of context area around point (pixels)
             delay: Delay before capture in seconds
+            save_full: Also save the full screenshot (see capture_region)
 
         Returns:
             Tuple of (full_screenshot_path, region_screenshot_path, region_dict)
@@ -155,7 +295,7 @@ class ScreenshotManager:
         region_height = context_size
 
         full_path, region_path = self.capture_region(
-            region_x, region_y, region_width, region_height, delay
+            region_x, region_y, region_width, region_height, delay, save_full
         )
 
         region_dict = {
@@ -167,30 +307,103 @@ class ScreenshotManager:
 
         return full_path, region_path, region_dict
 
-    def create_thumbnail(self, image_path: str, max_size: Tuple[int, int] = (150, 150)) -> str:
+    def capture_point_with_context_async(self, x: int, y: int, context_size: int = 100,
+                                         save_full: bool = True
+                                         ) -> Tuple[str, str, str, Dict[str, int]]:
+        """
+        Grab the screen now and write the full, region and thumbnail images in the background
+
+        The grab happens before returning so the image matches the moment of the
+        click; only the PNG encoding is deferred. Call wait_for_pending_saves()
+        before reading the files. With save_full=False only the context region
+        is grabbed and the full path is returned as "".
+
+        Returns:
+            Tuple of (full_screenshot_path, region_screenshot_path, thumbnail_path, region_dict)
+        """
+        half_size = context_size // 2
+        region_dict = {
+            'x': max(0, x - half_size),
+            'y': max(0, y - half_size),
+            'width': context_size,
+            'height': context_size
+        }
+
+        if save_full:
+            screenshot = self._grab()
+            full_filepath = self.screenshots_dir / self._generate_filename()
+        else:
+            screenshot = self._grab((region_dict['x'], region_dict['y'], context_size, context_size))
+            full_filepath = None
+        region_filepath = self.regions_dir / self._generate_filename("region")
+        thumb_filepath = self.thumbnails_dir / f"{region_filepath.stem}_thumb.jpg"
+
+        self._submit_save(self._save_capture, screenshot, region_dict,
+                          full_filepath, region_filepath, thumb_filepath)
+
+        return str(full_filepath or ""), str(region_filepath), str(thumb_filepath), region_dict
+
+    def _save_capture(self, screenshot: Image.Image, region_dict: Dict[str, int],
+                      full_filepath: Optional[Path], region_filepath: Path, thumb_filepath: Path):
+        """Write a capture taken by capture_point_with_context_async (worker thread)"""
+        try:
+            if full_filepath is None:
+                # Already grabbed at region size
+                region = screenshot
+            else:
+                screenshot.save(str(full_filepath), 'PNG', compress_level=self.CAPTURE_COMPRESS_LEVEL)
+
+                x, y = region_dict['x'], region_dict['y']
+                region = screenshot.crop((x, y, x + region_dict['width'], y + region_dict['height']))
+            region.save(str(region_filepath), 'PNG', compress_level=self.CAPTURE_COMPRESS_LEVEL)
+
+            # Thumbnail from the in-memory region instead of re-reading the file
+            region.thumbnail((150, 150), Image.Resampling.LANCZOS)
+            self._save_thumbnail(region, thumb_filepath)
+            logging.info(f"Region captured: {region_filepath}")
+        except Exception as e:
+            logging.error(f"Error saving capture: {str(e)}")
+
+    def wait_for_pending_saves(self, timeout: Optional[float] = None):
+        """Block until every capture queued on the background writer is on disk"""
+        with self._writer_lock:
+            pending, self._pending_saves = self._pending_saves, []
+        if pending:
+            wait(pending, timeout=timeout)
+
+    def _save_thumbnail(self, img: Image.Image, filepath: Path):
+        """Write a thumbnail or preview image as JPEG"""
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img.save(str(filepath), 'JPEG', quality=self.THUMBNAIL_QUALITY)
+
+    def create_thumbnail(self, image_path: str, max_size: Tuple[int, int] = (150, 150),
+                         image: Optional[Image.Image] = None) -> str:
         """
         Create thumbnail from image
 
         Args:
             image_path: Path to source image
             max_size: Maximum thumbnail size (width, height)
+            image: The source image if it is still in memory; saves re-reading
+                and decoding image_path
 
         Returns:
             Path to thumbnail
         """
         try:
-            img = Image.open(image_path)
+            img = image.copy() if image is not None else Image.open(image_path)
 
             # Calculate thumbnail size maintaining aspect ratio
             img.thumbnail(max_size, Image.Resampling.LANCZOS)
 
             # Generate thumbnail filename
             source_name = Path(image_path).stem
-            thumb_filename = f"{source_name}_thumb.png"
+            thumb_filename = f"{source_name}_thumb.jpg"
             thumb_filepath = self.thumbnails_dir / thumb_filename
 
             # Save thumbnail
-            img.save(str(thumb_filepath), 'PNG')
+            self._save_thumbnail(img, thumb_filepath)
             logging.info(f"Thumbnail created: {thumb_filepath}")
 
             return str(thumb_filepath)
@@ -219,11 +432,7 @@ class ScreenshotManager:
             img = Image.open(screenshot_path)
             draw = ImageDraw.Draw(img)
 
-            # Try to load a font, fall back to default if not available
-            try:
-                font = ImageFont.truetype("arial.ttf", 14)
-            except:
-                font = ImageFont.load_default()
+            font = _get_font(14)
 
             for ann in annotations:
                 ann_type = ann.get('type', 'box')
@@ -280,16 +489,21 @@ class ScreenshotManager:
         Args:
             days: Number of days to keep
         """
+        # Wall-clock on purpose: it is compared against file mtimes
         cutoff_time = time.time() - (days * 86400)
 
         for directory in [self.screenshots_dir, self.thumbnails_dir, self.regions_dir]:
-            for filepath in directory.glob("*.png"):
-                if filepath.stat().st_mtime < cutoff_time:
+            # scandir entries carry their stat result, so each file costs one syscall
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(('.png', '.jpg')):
+                        continue
                     try:
-                        filepath.unlink()
-                        logging.info(f"Deleted old screenshot: {filepath}")
-                    except Exception as e:
-                        logging.error(f"Error deleting {filepath}: {str(e)}")
+                        if entry.stat().st_mtime < cutoff_time:
+                            os.unlink(entry.path)
+                            logging.info(f"Deleted old screenshot: {entry.path}")
+                    except OSError as e:
+                        logging.error(f"Error deleting {entry.path}: {str(e)}")
 
     def create_action_preview(self, action_type: str, region_path: str,
                              output_size: Tuple[int, int] = (250, 70)) -> str:
@@ -320,10 +534,10 @@ class ScreenshotManager:
             preview.paste(region_img, (10, 10))
 
             # Generate preview filename
-            preview_filename = Path(region_path).stem + "_preview.png"
+            preview_filename = Path(region_path).stem + "_preview.jpg"
             preview_filepath = self.thumbnails_dir / preview_filename
 
-            preview.save(str(preview_filepath), 'PNG')
+            self._save_thumbnail(preview, preview_filepath)
 
             return str(preview_filepath)
 
@@ -342,6 +556,7 @@ if __name__ == "__main__":
     print("Capturing full screen in 2 seconds...")
     full_path = manager.capture_full_screen(delay=2.0)
     print(f"Saved to: {full_path}")
+    manager.wait_for_pending_saves()
 
     # Test thumbnail creation
     if full_path:
@@ -6,10 +6,19 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable, Dict, Any
 from src.theme import ModernTheme, Icons
+from src.property_editor import ActionPropertyPanel
+
+
+def _wheel_bindings(widget) -> list:
+    """(event sequence, event -> scroll units) pairs for this windowing system's wheel"""
+    if widget.tk.call('tk', 'windowingsystem') == 'x11':
+        # X11 reports wheel notches as button 4/5 presses with no delta
+        return [('<Button-4>', lambda event: -1), ('<Button-5>', lambda event: 1)]
+    return [('<MouseWheel>', lambda event: -1 * (event.delta // 120))]
 
 
 class ResizablePane(ttk.Frame):
-    """A pane with a draggable resize handle"""
+    """A side pane resized by dragging its sash in StudioLayout"""
 
     def __init__(self, parent, side: str = 'left', min_width: int = 200,
                  max_width: Optional[int] = None, **kwargs):
@@ -19,53 +28,9 @@ class ResizablePane(ttk.Frame):
         self.max_width = max_width
         self.current_width = min_width
 
-        self.is_resizing = False
-        self.resize_start_x = 0
-        self.resize_start_width = 0
-
         self.configure(width=self.current_width)
         self.pack_propagate(False)
 
-    def add_resize_handle(self):
-        handle = tk.Frame(self, width=4, cursor='sb_h_double_arrow',
-                            bg=ModernTheme.BORDER)
-        if self.side == 'left':
-            handle.pack(side=tk.RIGHT, fill=tk.Y)
-        else:
-            handle.pack(side=tk.LEFT, fill=tk.Y)
-
-        handle.bind('<Button-1>', self._start_resize)
-        handle.bind('<B1-Motion>', self._do_resize)
-        handle.bind('<ButtonRelease-1>', self._stop_resize)
-
-        return handle
-
-    def _start_resize(self, event):
-        self.is_resizing = True
-        self.resize_start_x = event.x_root
-        self.resize_start_width = self.current_width
-
-    def _do_resize(self, event):
-        if not self.is_resizing:
-            return
-
-        delta = event.x_root - self.resize_start_x
-
-        if self.side == 'left':
-            new_width = self.resize_start_width + delta
-        else:
-            new_width = self.resize_start_width - delta
-
-        new_width = max(self.min_width, new_width)
-        if self.max_width:
-            new_width = min(self.max_width, new_width)
-
-        self.current_width = new_width
-        self.configure(width=self.current_width)
-
-    def _stop_resize(self, event):
-        self.is_resizing = False
-
 
 class WorkflowPanel(ResizablePane):
     def __init__(self, parent, callbacks: Optional[Dict[str, Callable]] = None):
@@ -73,22 +38,26 @@ class WorkflowPanel(ResizablePane):
         self.callbacks = callbacks or {}
 
         self.configure(style='TFrame')
+        # One application-wide binding filtered by widget path, so cards need no
+        # per-widget setup when they are created
+        for sequence, units in _wheel_bindings(self):
+            self.bind_all(sequence, lambda e, units=units: self._on_any_mousewheel(e, units(e)), add='+')
 
         self._create_header()
         self._create_action_container()
         self._create_footer()
-        self.add_resize_handle()
 
     def _create_header(self):
         header = ttk.Frame(self, style='TFrame', height=60)
         header.pack(fill=tk.X, padx=ModernTheme.PADDING_LG, pady=(ModernTheme.PADDING_LG, 0))
         header.pack_propagate(False)
 
-        title_label = ttk.Label(header, text="Workflow", font=(ModernTheme.FONT_FAMILY, 16, 'bold'))
+        title_label = ttk.Label(header, text="Workflow", font=ModernTheme.PANEL_TITLE_FONT)
         title_label.pack(side=tk.LEFT, anchor=tk.W)
 
         self.counter_label = ttk.Label(header, text="0 steps", style='Secondary.TLabel')
         self.counter_label.pack(side=tk.RIGHT, anchor=tk.E)
+        self._counter_value = 0
 
     def _create_action_container(self):
         container = ttk.Frame(self, style='TFrame')
@@ -102,16 +71,32 @@ class WorkflowPanel(ResizablePane):
         self.canvas = tk.Canvas(container, bg=ModernTheme.BACKGROUND, highlightthickness=0)
         self.canvas.grid(row=0, column=0, sticky='nsew')
 
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
         self.scrollbar.configure(command=self.canvas.yview)
+        self._load_more_after_id = None
 
         self.actions_frame = ttk.Frame(self.canvas, style='TFrame')
         self.canvas_window = self.canvas.create_window((0, 0), window=self.actions_frame, anchor=tk.NW)
 
+        self._scroll_after_id = None
+        self._wheel_units = 0
+        self._wheel_after_id = None
+        self._canvas_width = 0
+        self._pending_canvas_width = 0
+        self._canvas_after_id = None
         self.actions_frame.bind('<Configure>', self._on_frame_configure)
         self.canvas.bind('<Configure>', self._on_canvas_configure)
-        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
-        self.actions_frame.bind('<MouseWheel>', self._on_mousewheel)
+        self._canvas_path = str(self.canvas)
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Near the bottom (or nothing to scroll): ask for more cards if there are any
+        if float(last) >= 0.9 and 'load_more' in self.callbacks and self._load_more_after_id is None:
+            self._load_more_after_id = self.after_idle(self._request_more)
+
+    def _request_more(self):
+        self._load_more_after_id = None
+        self.callbacks['load_more']()
 
     def _check_scrollbar(self):
         """Show/hide scrollbar based on content height"""
@@ -123,18 +108,48 @@ class WorkflowPanel(ResizablePane):
             self.scrollbar_visible = False
 
     def _on_frame_configure(self, event=None):
+        # Adding many rows fires a Configure per layout pass; measure once when idle
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.canvas.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scroll_after_id = None
         self.canvas.configure(scrollregion=self.canvas.bbox('all'))
         self._check_scrollbar()
 
     def _on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        # Window drags fire Configure continuously; reflow the content at most every 33 ms
+        self._pending_canvas_width = event.width
+        if self._canvas_after_id is None:
+            self._canvas_after_id = self.canvas.after(33, self._apply_canvas_width)
+
+    def _apply_canvas_width(self):
+        self._canvas_after_id = None
+        # Height-only changes need no reflow, just the scrollbar check
+        if self._pending_canvas_width != self._canvas_width:
+            self._canvas_width = self._pending_canvas_width
+            self.canvas.itemconfig(self.canvas_window, width=self._canvas_width)
         self._check_scrollbar()
 
-    def _on_mousewheel(self, event):
+    def _scroll_units(self, units: int):
         """Only scroll if scrollbar is visible"""
         if hasattr(self, 'scrollbar_visible') and self.scrollbar_visible:
-            delta = -1 * (event.delta // 120)
-            self.canvas.yview_scroll(delta, 'units')
+            # Trackpads send many ticks per frame; sum them and scroll once per frame
+            self._wheel_units += units
+            if self._wheel_after_id is None:
+                self._wheel_after_id = self.canvas.after(16, self._flush_wheel)
+
+    def _flush_wheel(self):
+        self._wheel_after_id = None
+        units, self._wheel_units = self._wheel_units, 0
+        if units:
+            self.canvas.yview_scroll(units, 'units')
+
+    def _on_any_mousewheel(self, event, units: int):
+        """Scroll the list for wheel events over the canvas or any card inside it"""
+        path = str(event.widget)
+        if path == self._canvas_path or path.startswith(self._canvas_path + '.'):
+            self._scroll_units(units)
 
     def _create_footer(self):
         footer = ttk.Frame(self, style='TFrame', height=60)
@@ -149,6 +164,9 @@ class WorkflowPanel(ResizablePane):
             self.callbacks['add_step']()
 
     def update_counter(self, count: int):
+        if count == self._counter_value:
+            return
+        self._counter_value = count
         self.counter_label.config(text=f"{count} step{'s' if count != 1 else ''}")
 
     def clear_actions(self):
@@ -156,11 +174,6 @@ class WorkflowPanel(ResizablePane):
             widget.destroy()
         self.update_counter(0)
 
-    def bind_mousewheel_to_widget(self, widget):
-        widget.bind('<MouseWheel>', self._on_mousewheel)
-        for child in widget.winfo_children():
-            self.bind_mousewheel_to_widget(child)
-
 
 class CanvasPanel(ttk.Frame):
     def __init__(self, parent):
@@ -175,7 +188,7 @@ class CanvasPanel(ttk.Frame):
         header.pack(fill=tk.X, padx=ModernTheme.PADDING_LG, pady=(ModernTheme.PADDING_LG, 0))
         header.pack_propagate(False)
 
-        title_label = ttk.Label(header, text="Visual Canvas", font=(ModernTheme.FONT_FAMILY, 16, 'bold'))
+        title_label = ttk.Label(header, text="Visual Canvas", font=ModernTheme.PANEL_TITLE_FONT)
         title_label.pack(side=tk.LEFT, anchor=tk.W)
 
         self.info_label = ttk.Label(header, text="No screenshot", style='Secondary.TLabel')
@@ -205,8 +218,9 @@ class CanvasPanel(ttk.Frame):
         self._check_scrollbars()
 
         self.placeholder_text = self.canvas.create_text(0, 0, text="📸 No screenshot loaded",
-                                                       font=(ModernTheme.FONT_FAMILY, 14),
+                                                       font=ModernTheme.PLACEHOLDER_FONT,
                                                        fill=ModernTheme.MUTED_FOREGROUND)
+        self._placeholder_size = (0, 0)
         self.canvas.bind('<Configure>', self._center_placeholder)
 
     def _on_xscroll(self, first, last):
@@ -237,9 +251,15 @@ class CanvasPanel(ttk.Frame):
         self.v_scrollbar_visible = False
 
     def _center_placeholder(self, event=None):
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-        self.canvas.coords(self.placeholder_text, width // 2, height // 2)
+        if event is not None:
+            size = (event.width, event.height)
+        else:
+            size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+        # Configure also fires for moves; only re-center when the size changed
+        if size == self._placeholder_size:
+            return
+        self._placeholder_size = size
+        self.canvas.coords(self.placeholder_text, size[0] // 2, size[1] // 2)
 
     def _create_toolbar(self):
         toolbar = ttk.Frame(self, style='TFrame', height=50)
@@ -266,7 +286,6 @@ class PropertiesPanel(ResizablePane):
 
         self._create_header()
         self._create_content_area()
-        self.add_resize_handle()
         self._show_placeholder()
 
     def _create_header(self):
@@ -274,7 +293,7 @@ class PropertiesPanel(ResizablePane):
         header.pack(fill=tk.X, padx=ModernTheme.PADDING_LG, pady=(ModernTheme.PADDING_LG, 0))
         header.pack_propagate(False)
 
-        self.title_label = ttk.Label(header, text="Properties", font=(ModernTheme.FONT_FAMILY, 16, 'bold'))
+        self.title_label = ttk.Label(header, text="Properties", font=ModernTheme.PANEL_TITLE_FONT)
         self.title_label.pack(side=tk.LEFT, anchor=tk.W)
 
     def _create_content_area(self):
@@ -295,10 +314,18 @@ class PropertiesPanel(ResizablePane):
         self.content_frame = ttk.Frame(self.canvas, style='TFrame')
         self.canvas_window = self.canvas.create_window((0, 0), window=self.content_frame, anchor=tk.NW)
 
+        self._scroll_after_id = None
+        self._wheel_units = 0
+        self._wheel_after_id = None
+        self._canvas_width = 0
+        self._pending_canvas_width = 0
+        self._canvas_after_id = None
         self.content_frame.bind('<Configure>', self._on_frame_configure)
         self.canvas.bind('<Configure>', self._on_canvas_configure)
-        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
-        self.content_frame.bind('<MouseWheel>', self._on_mousewheel)
+        for sequence, units in _wheel_bindings(self):
+            handler = lambda e, units=units: self._scroll_units(units(e))
+            self.canvas.bind(sequence, handler)
+            self.content_frame.bind(sequence, handler)
 
     def _check_scrollbar(self):
         """Show/hide scrollbar based on content height"""
@@ -310,21 +337,46 @@ class PropertiesPanel(ResizablePane):
             self.scrollbar_visible = False
 
     def _on_frame_configure(self, event=None):
+        # Adding many rows fires a Configure per layout pass; measure once when idle
+        if self._scroll_after_id is None:
+            self._scroll_after_id = self.canvas.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._scroll_after_id = None
         self.canvas.configure(scrollregion=self.canvas.bbox('all'))
         self._check_scrollbar()
 
     def _on_canvas_configure(self, event):
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        # Window drags fire Configure continuously; reflow the content at most every 33 ms
+        self._pending_canvas_width = event.width
+        if self._canvas_after_id is None:
+            self._canvas_after_id = self.canvas.after(33, self._apply_canvas_width)
+
+    def _apply_canvas_width(self):
+        self._canvas_after_id = None
+        # Height-only changes need no reflow, just the scrollbar check
+        if self._pending_canvas_width != self._canvas_width:
+            self._canvas_width = self._pending_canvas_width
+            self.canvas.itemconfig(self.canvas_window, width=self._canvas_width)
         self._check_scrollbar()
 
-    def _on_mousewheel(self, event):
+    def _scroll_units(self, units: int):
         """Only scroll if scrollbar is visible"""
         if hasattr(self, 'scrollbar_visible') and self.scrollbar_visible:
-            delta = -1 * (event.delta // 120)
-            self.canvas.yview_scroll(delta, 'units')
+            # Trackpads send many ticks per frame; sum them and scroll once per frame
+            self._wheel_units += units
+            if self._wheel_after_id is None:
+                self._wheel_after_id = self.canvas.after(16, self._flush_wheel)
+
+    def _flush_wheel(self):
+        self._wheel_after_id = None
+        units, self._wheel_units = self._wheel_units, 0
+        if units:
+            self.canvas.yview_scroll(units, 'units')
 
     def _show_placeholder(self):
         self.clear_content()
+        self.action_panel = None
         placeholder = ttk.Label(self.content_frame, text="Select an action to see its properties",
                                style='Secondary.TLabel', justify=tk.CENTER)
         placeholder.pack(expand=True, pady=100)
@@ -334,11 +386,12 @@ class PropertiesPanel(ResizablePane):
             widget.destroy()
 
     def show_action_properties(self, action, on_change=None, batch_columns=None, on_recapture=None):
-        from src.property_editor import ActionPropertyPanel
-        self.clear_content()
         self.title_label.config(text=f"Properties: {action.type.upper()}")
-        ActionPropertyPanel(self.content_frame, action, on_change=on_change,
-                          batch_columns=batch_columns, on_recapture=on_recapture)
+        if self.action_panel is None:
+            self.clear_content()
+            self.action_panel = ActionPropertyPanel(self.content_frame)
+        self.action_panel.set_action(action, on_change=on_change,
+                                     batch_columns=batch_columns, on_recapture=on_recapture)
 
 
 class StudioLayout(ttk.Frame):
@@ -348,14 +401,43 @@ class StudioLayout(ttk.Frame):
 
         self.pack(fill=tk.BOTH, expand=True, padx=ModernTheme.PADDING_LG, pady=ModernTheme.PADDING_LG)
 
-        self.workflow_panel = WorkflowPanel(self, callbacks=callbacks)
-        self.workflow_panel.pack(side=tk.LEFT, fill=tk.BOTH)
+        # Native sash dragging; Tk does the hit-testing, clamping to minsize and relayout in C
+        self.paned = tk.PanedWindow(self, orient=tk.HORIZONTAL, sashwidth=4, sashrelief=tk.FLAT,
+                                    bd=0, bg=ModernTheme.BORDER, sashcursor='sb_h_double_arrow')
+        self.paned.pack(fill=tk.BOTH, expand=True)
 
+        self.workflow_panel = WorkflowPanel(self, callbacks=callbacks)
         self.properties_panel = PropertiesPanel(self)
-        self.properties_panel.pack(side=tk.RIGHT, fill=tk.BOTH)
-
         self.canvas_panel = CanvasPanel(self)
-        self.canvas_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=ModernTheme.PADDING_MD)
+
+        self.paned.add(self.workflow_panel, width=self.workflow_panel.current_width,
+                       minsize=self.workflow_panel.min_width, stretch='never')
+        self.paned.add(self.canvas_panel, minsize=200, stretch='always')
+        self.paned.add(self.properties_panel, width=self.properties_panel.current_width,
+                       minsize=self.properties_panel.min_width, stretch='never')
+
+        # PanedWindow has no maximum pane size; pull the sashes back after a drag
+        self.paned.bind('<B1-Motion>', self._schedule_clamp, add='+')
+        self.paned.bind('<ButtonRelease-1>', self._schedule_clamp, add='+')
+        self._clamp_after_id = None
+
+    def _schedule_clamp(self, event=None):
+        # Class bindings move the sash after this widget binding runs
+        if self._clamp_after_id is None:
+            self._clamp_after_id = self.after_idle(self._clamp_side_panes)
+
+    def _clamp_side_panes(self):
+        self._clamp_after_id = None
+        sash_width = int(self.paned.cget('sashwidth'))
+
+        x, y = self.paned.sash_coord(0)
+        if x > self.workflow_panel.max_width:
+            self.paned.sash_place(0, self.workflow_panel.max_width, y)
+
+        x, y = self.paned.sash_coord(1)
+        max_x = self.paned.winfo_width() - self.properties_panel.max_width - sash_width
+        if x < max_x:
+            self.paned.sash_place(1, max_x, y)
 
 
 if __name__ == "__main__":
@@ -24,14 +24,14 @@ class TemplateManager:
         dialog.grab_set()
 
         header = Label(dialog, text="📋 Select Template",
-                         font=(ModernTheme.FONT_FAMILY, 14, 'bold'),
+                         font=ModernTheme.DIALOG_TITLE_FONT,
                          bg=ModernTheme.PRIMARY, fg='white', pady=15)
         header.pack(fill='x')
 
         list_frame = Frame(dialog, bg=ModernTheme.BACKGROUND, padx=20, pady=20)
         list_frame.pack(fill='both', expand=True)
 
-        listbox = Listbox(list_frame, font=(ModernTheme.FONT_FAMILY, 10),
+        listbox = Listbox(list_frame, font=ModernTheme.BODY_FONT,
                             height=10, bg=ModernTheme.CARD, fg=ModernTheme.CARD_FOREGROUND)
         listbox.pack(fill='both', expand=True)
 
@@ -65,11 +65,12 @@ class TemplateManager:
                 template = templates[template_ids[idx]]
                 actions = template.create_actions()
 
-                for action in actions:
-                    action.ui.order = len(self.app.actions)
-                    self.app.actions.append(action)
+                with self.app.batched_updates():
+                    for action in actions:
+                        action.ui.order = len(self.app.actions)
+                        self.app.actions.append(action)
 
-                self.app._refresh_workflow()
+                    self.app._refresh_workflow()
                 self.app.update_status(f"Inserted template: {template.name}")
                 dialog.destroy()
 
@@ -113,7 +114,7 @@ class TemplateManager:
         dialog.transient(self.app.root)
 
         header = Label(dialog, text="📚 Template Browser",
-                         font=(ModernTheme.FONT_FAMILY, 14, 'bold'),
+                         font=ModernTheme.DIALOG_TITLE_FONT,
                          bg=ModernTheme.PRIMARY, fg='white', pady=15)
         header.pack(fill='x')
 
@@ -3,15 +3,56 @@ Modern theme and styling for Amazon Simulator
 """
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 from src.theme_shadcn import ShadcnTheme
 
 class ModernTheme(ShadcnTheme):
     """Modern professional theme for UI components"""
 
+    # Named fonts registered by configure_style(); pass these names as font=
+    # so widgets share one Tk font object instead of resolving a tuple each time
+    EDITOR_FONT = 'Editor.Body'
+    EDITOR_FONT_BOLD = 'Editor.Bold'
+    SMALL_BOLD_FONT = 'Small.Bold'
+    CARD_ICON_FONT = 'Card.Icon'
+    PANEL_TITLE_FONT = 'Panel.Title'
+    DIALOG_TITLE_FONT = 'Dialog.Title'
+    BODY_FONT = 'Text.Body'
+    PLACEHOLDER_FONT = 'Canvas.Placeholder'
+
+    # Tk deletes a named font when its Font object is collected, so keep them
+    _named_fonts = {}
+
+    @staticmethod
+    def _create_named_fonts():
+        """Register the shared named fonts once per interpreter"""
+        specs = {
+            ModernTheme.EDITOR_FONT: dict(family=ModernTheme.FONT_FAMILY, size=ModernTheme.FONT_SIZE_MD),
+            ModernTheme.EDITOR_FONT_BOLD: dict(family=ModernTheme.FONT_FAMILY, size=ModernTheme.FONT_SIZE_MD, weight='bold'),
+            ModernTheme.SMALL_BOLD_FONT: dict(family=ModernTheme.FONT_FAMILY, size=ModernTheme.FONT_SIZE_SM, weight='bold'),
+            ModernTheme.CARD_ICON_FONT: dict(family='Segoe UI Emoji', size=18),
+            ModernTheme.PANEL_TITLE_FONT: dict(family=ModernTheme.FONT_FAMILY, size=16, weight='bold'),
+            ModernTheme.DIALOG_TITLE_FONT: dict(family=ModernTheme.FONT_FAMILY, size=14, weight='bold'),
+            ModernTheme.BODY_FONT: dict(family=ModernTheme.FONT_FAMILY, size=10),
+            ModernTheme.PLACEHOLDER_FONT: dict(family=ModernTheme.FONT_FAMILY, size=14),
+        }
+        existing_fonts = tkfont.names()
+        for name, options in specs.items():
+            if name not in existing_fonts:
+                ModernTheme._named_fonts[name] = tkfont.Font(name=name, **options)
+
     @staticmethod
     def configure_style():
         """Configure ttk styles for a modern look"""
         style = ttk.Style()
+
+        # Styles live on the Tk interpreter, so a single lookup tells us whether
+        # this interpreter has already been configured and the rest can be skipped
+        if style.lookup('Card.TFrame', 'background') == ModernTheme.CARD:
+            return
+
+        ModernTheme._create_named_fonts()
+
         style.theme_use('clam')
 
         # General widget styling
@@ -24,6 +65,8 @@ class ModernTheme(ShadcnTheme):
 
         # Frame and LabelFrame
         style.configure('TFrame', background=ModernTheme.BACKGROUND)
+        # One-pixel frame used as a horizontal rule
+        style.configure('Separator.TFrame', background=ModernTheme.BORDER)
         style.configure('TLabelFrame', background=ModernTheme.BACKGROUND, borderwidth=1, relief="solid")
         style.configure('TLabelFrame.Label', foreground=ModernTheme.MUTED_FOREGROUND, background=ModernTheme.BACKGROUND)
 
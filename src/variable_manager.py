@@ -101,7 +101,7 @@ class VariableManagerDialog(tk.Toplevel):
             text_frame.pack(fill=tk.BOTH, expand=True)
             
             # Create text widget and scrollbars
-            text_widget = tk.Text(text_frame, width=20, font=(ModernTheme.FONT_FAMILY, 10),
+            text_widget = tk.Text(text_frame, width=20, font=ModernTheme.BODY_FONT,
                                   bg=ModernTheme.CARD, fg=ModernTheme.CARD_FOREGROUND,
                                   wrap=tk.NONE, borderwidth=1, relief=tk.SOLID)
             
@@ -45,6 +45,7 @@ class VisualCanvas(ttk.Frame):
         self.on_annotation_click = on_annotation_click
         self.on_annotation_double_click = on_annotation_double_click
         self.on_zoom_change = on_zoom_change
+        self._zoom_after_id = None
         self._bind_events()
 
     def _bind_events(self):
@@ -155,7 +156,7 @@ class VisualCanvas(ttk.Frame):
             annotation.items.append(rect)
 
         label_bg = self.canvas.create_rectangle(x, y - 20, x + 30, y, fill=color, outline='', tags='annotation')
-        label_text = self.canvas.create_text(x + 15, y - 10, text=f"#{annotation.action_index + 1}", font=(ModernTheme.FONT_FAMILY, ModernTheme.FONT_SIZE_SM, 'bold'), fill=ModernTheme.POPOVER_FOREGROUND, tags='annotation')
+        label_text = self.canvas.create_text(x + 15, y - 10, text=f"#{annotation.action_index + 1}", font=ModernTheme.SMALL_BOLD_FONT, fill=ModernTheme.POPOVER_FOREGROUND, tags='annotation')
         annotation.items.extend([label_bg, label_text])
         self.canvas.tag_raise('annotation')
 
@@ -189,6 +190,12 @@ class VisualCanvas(ttk.Frame):
     def _on_mouse_wheel(self, event):
         factor = 1.1 if event.delta > 0 else 0.9
         self.zoom_level = max(0.1, min(self.zoom_level * factor, 5.0))
+        # A fast wheel sends several notches per frame; resample the screenshot once for all of them
+        if self._zoom_after_id is None:
+            self._zoom_after_id = self.canvas.after(16, self._apply_wheel_zoom)
+
+    def _apply_wheel_zoom(self):
+        self._zoom_after_id = None
         self._update_display()
 
     def _on_pan_start(self, event):
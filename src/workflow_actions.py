@@ -26,7 +26,8 @@ class WorkflowActions:
         else:
             self.app.selected_action_indices = [index]
 
-        # Update UI
+        # Update UI; a selection made from the canvas may be past the cards built so far
+        self.app._materialize_cards(max(self.app.selected_action_indices, default=-1) + 1)
         for i, card in enumerate(self.app.action_cards):
             if i in self.app.selected_action_indices:
                 card.select()
@@ -60,14 +61,15 @@ class WorkflowActions:
             return
 
         if messagebox.askyesno("Delete Actions", f"Delete {len(self.app.selected_action_indices)} selected actions?"):
-            # Sort indices in reverse order to avoid index shifting issues
-            for index in sorted(self.app.selected_action_indices, reverse=True):
-                self.app.visual_canvas.remove_annotation(index)
-                self.app.actions.pop(index)
-                self.app.comment_manager.core_manager.shift_indices_after_delete(index)
-            
-            self.app.selected_action_indices.clear()
-            self.app._refresh_workflow()
+            with self.app.batched_updates():
+                # Sort indices in reverse order to avoid index shifting issues
+                for index in sorted(self.app.selected_action_indices, reverse=True):
+                    self.app.visual_canvas.remove_annotation(index)
+                    self.app.actions.pop(index)
+                    self.app.comment_manager.core_manager.shift_indices_after_delete(index)
+
+                self.app.selected_action_indices.clear()
+                self.app._refresh_workflow()
             self.app.update_status(f"Deleted selected actions")
             self.app.is_dirty = True
 
@@ -85,7 +87,8 @@ class WorkflowActions:
     def duplicate_selected(self):
         """Duplicate selected action"""
         if self.app.selected_action_index is not None:
-            self.duplicate_action(self.app.selected_action_index)
+            with self.app.batched_updates():
+                self.duplicate_action(self.app.selected_action_index)
 
     def reorder_action(self, from_index: int, to_index: int):
         """Reorder action by drag-and-drop"""
@@ -119,10 +122,7 @@ class WorkflowActions:
 
             self.app._refresh_workflow()
 
-            self.app.visual_canvas.clear_annotations()
-            for i, act in enumerate(self.app.actions):
-                if act.has_visual_data():
-                    self.app._add_canvas_annotation(act, i)
+            self.app._redraw_canvas_annotations()
 
             self.select_action(to_index)
 
@@ -68,7 +68,7 @@ class CommentDialog:
         header.pack_propagate(False)
 
         title = tk.Label(header, text="📝 Add Comment",
-                        font=(ModernTheme.FONT_FAMILY, 14, 'bold'),
+                        font=ModernTheme.DIALOG_TITLE_FONT,
                         bg=ModernTheme.PRIMARY, fg='white')
         title.pack(pady=15)
 
@@ -79,13 +79,13 @@ class CommentDialog:
         # Info
         info = tk.Label(content,
                        text="Add a note or reminder for this action:",
-                       font=(ModernTheme.FONT_FAMILY, 10),
+                       font=ModernTheme.BODY_FONT,
                        bg=ModernTheme.BACKGROUND, fg=ModernTheme.FOREGROUND,
                        justify=tk.LEFT)
         info.pack(anchor=tk.W, pady=(0, 10))
 
         # Text area
-        self.text = tk.Text(content, font=(ModernTheme.FONT_FAMILY, 10),
+        self.text = tk.Text(content, font=ModernTheme.BODY_FONT,
                            height=8, wrap=tk.WORD,
                            bg=ModernTheme.CARD, fg=ModernTheme.CARD_FOREGROUND,
                            relief=tk.SOLID, borderwidth=1, padx=5, pady=5)
@@ -100,7 +100,7 @@ class CommentDialog:
         button_frame.pack(fill=tk.X)
 
         cancel_btn = tk.Button(button_frame, text="Cancel",
-                               font=(ModernTheme.FONT_FAMILY, 10),
+                               font=ModernTheme.BODY_FONT,
                                bg=ModernTheme.CARD, fg=ModernTheme.CARD_FOREGROUND,
                                relief=tk.FLAT, padx=20, pady=8,
                                cursor='hand2',
@@ -200,6 +200,11 @@ class CommentManager:
         """Check if action has comment"""
         return action_index in self.comments
 
+    @property
+    def comments_by_index(self) -> dict[int, WorkflowComment]:
+        """Live mapping of action index to comment (not a copy)"""
+        return self.comments
+
     def remove_comment(self, action_index: int):
         """Remove comment from action"""
         if action_index in self.comments:
@@ -282,7 +287,7 @@ if __name__ == "__main__":
     container.pack(fill=tk.BOTH, expand=True)
 
     title = tk.Label(container, text="Action Comments",
-                    font=(ModernTheme.FONT_FAMILY, 14, 'bold'),
+                    font=ModernTheme.DIALOG_TITLE_FONT,
                     bg=ModernTheme.BACKGROUND, fg=ModernTheme.FOREGROUND)
     title.pack(anchor=tk.W, pady=(0, 15))
 
@@ -302,7 +307,7 @@ if __name__ == "__main__":
             print(f"Saved comment: {result}")
 
     btn = tk.Button(container, text="Add New Comment",
-                   font=(ModernTheme.FONT_FAMILY, 10),
+                   font=ModernTheme.BODY_FONT,
                    command=show_dialog)
     btn.pack(pady=20)
 
@@ -22,36 +22,38 @@ class WorkflowManager:
                 with open(filepath, 'r', encoding='utf-8') as f:
                     data = json.load(f)
 
-                actions_data = data.get('actions', [])
-                self.app.actions = [EnhancedAction.from_dict(a) for a in actions_data]
-                self.app.batch_columns = data.get('batch_columns', [])
-                self.app.batch_data = data.get('batch_data', [])
-                # For backward compatibility with old format
-                if not self.app.batch_data and 'batch_variables' in data:
-                    self.app.batch_columns = ['variable']
-                    self.app.batch_data = [{'variable': var} for var in data['batch_variables']]
-
-                self.app._refresh_workflow()
-
-                # Load comments if present
-                if 'comments' in data:
-                    self.app.comment_manager.core_manager.from_dict(data['comments'])
-
-                # Load first screenshot if available
-                for action in self.app.actions:
-                    if action.has_visual_data() and action.visual.screenshot_path:
-                        try:
-                            from PIL import Image
-                            screenshot = Image.open(action.visual.screenshot_path)
-                            self.app.visual_canvas.load_screenshot(screenshot)
-
-                            # Add all annotations
-                            for i, act in enumerate(self.app.actions):
-                                if act.has_visual_data():
-                                    self.app._add_canvas_annotation(act, i)
-                            break
-                        except:
-                            pass
+                with self.app.batched_updates():
+                    actions_data = data.get('actions', [])
+                    self.app.actions = [EnhancedAction.from_dict(a) for a in actions_data]
+                    # Old selections point at actions of the previous workflow
+                    self.app.selected_action_indices = []
+                    self.app.selected_action_index = None
+                    self.app.batch_columns = data.get('batch_columns', [])
+                    self.app.batch_data = data.get('batch_data', [])
+                    # For backward compatibility with old format
+                    if not self.app.batch_data and 'batch_variables' in data:
+                        self.app.batch_columns = ['variable']
+                        self.app.batch_data = [{'variable': var} for var in data['batch_variables']]
+
+                    self.app._refresh_workflow()
+
+                    # Load comments if present
+                    if 'comments' in data:
+                        self.app.comment_manager.core_manager.from_dict(data['comments'])
+
+                    # Load first screenshot if available
+                    for action in self.app.actions:
+                        if action.has_visual_data() and action.visual.screenshot_path:
+                            try:
+                                from PIL import Image
+                                screenshot = Image.open(action.visual.screenshot_path)
+                                self.app.visual_canvas.load_screenshot(screenshot)
+
+                                # Add all annotations
+                                self.app._redraw_canvas_annotations()
+                                break
+                            except:
+                                pass
 
                 self.app.update_status(f"Loaded {len(self.app.actions)} actions")
                 messagebox.showinfo("Success", f"Loaded {len(self.app.actions)} actions")
@@ -78,6 +80,9 @@ class WorkflowManager:
 
         if filepath:
             try:
+                # Don't reference screenshots that are still being written
+                self.app.screenshot_manager.wait_for_pending_saves()
+
                 data = {
                     'version': '2.1',
                     'created': datetime.now().isoformat(),
@@ -145,6 +150,8 @@ class WorkflowManager:
 
         self.app.actions.clear()
         self.app.action_cards.clear()
+        self.app.selected_action_indices = []
+        self.app.selected_action_index = None
         self.app.visual_canvas.clear_annotations()
         self.app.visual_canvas.load_screenshot(None)
         self.app.comment_manager.core_manager.comments.clear()